@@ -0,0 +1,50 @@
+import re
+
+from tokenizer import normalize
+
+# 단어 경계 ("APN-200A" 의 "200A", "인터넷(프리밴)" 의 "프리밴" 으로도 찾을 수 있게)
+_WORD_START_RE = re.compile(r"(?<=[\s(/\-])[^\s(/\-]")
+
+
+class _Node:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children = {}
+        self.top = []
+
+
+class Autocomplete:
+    """접두사 트라이. 각 노드에 상위 k 개 완성어를 미리 담아 두어
+    조회 비용이 접두사 길이에만 비례한다 (어휘 크기와 무관)."""
+
+    def __init__(self, entries, k: int = 5):
+        """entries: [(표시 문자열, 우선순위), ...] — 우선순위가 작을수록 먼저 나온다."""
+        self.k = k
+        self._root = _Node()
+        for label, priority in entries:
+            rank = (priority, len(label), label)
+            for key in self._keys(label):
+                self._insert(key, rank)
+
+    @staticmethod
+    def _keys(label: str):
+        text = normalize(label)
+        return [text] + [text[m.start():] for m in _WORD_START_RE.finditer(text)]
+
+    def _insert(self, key: str, rank):
+        node = self._root
+        for char in key:
+            node = node.children.setdefault(char, _Node())
+            if rank not in node.top:
+                node.top.append(rank)
+                node.top.sort()
+                del node.top[self.k:]
+
+    def complete(self, prefix: str, limit: int = None):
+        node = self._root
+        for char in normalize(prefix.strip()):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return [label for _, _, label in node.top[:limit or self.k]]
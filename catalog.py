@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass
+
+import pandas as pd
+
+# 스위칭 용량 문자열 정규화
+#  - "2.4Tera", "560G", "32G/14G" 같은 표기를 Gbps 숫자로 바꿔, 차트/필터가
+#    행마다 문자열을 해석하지 않고 숫자 컬럼을 그대로 쓸 수 있게 한다.
+#  - 모르는 표기는 0 으로 넘기지 않고 ValueError 를 낸다 (데이터 입력 실수를 바로 드러내기 위해).
+MIN_CAPACITY_COLUMN = "최소용량(Gbps)"
+MAX_CAPACITY_COLUMN = "최대용량(Gbps)"
+
+_CAPACITY_UNITS = {"t": 1000, "tera": 1000, "tbps": 1000, "g": 1, "giga": 1, "gbps": 1, "m": 0.001, "mbps": 0.001}
+_CAPACITY_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([a-z]+)\s*$")
+
+
+def parse_capacity(text: str):
+    """용량 표기를 (최소 Gbps, 최대 Gbps) 로. "32G/14G" 처럼 여러 값이면 범위가 된다."""
+    values = []
+    for part in str(text).split("/"):
+        match = _CAPACITY_RE.match(part.lower())
+        if not match or match.group(2) not in _CAPACITY_UNITS:
+            raise ValueError(f"스위칭 용량 표기를 해석할 수 없습니다: '{text}'")
+        values.append(float(match.group(1)) * _CAPACITY_UNITS[match.group(2)])
+    return min(values), max(values)
+
+
+def add_capacity_columns(specs, column: str = "스위칭용량"):
+    """specs 에 최소/최대 용량(Gbps) 숫자 컬럼을 더한 새 DataFrame."""
+    bounds = [parse_capacity(text) for text in specs[column]]
+    return specs.assign(**{
+        MIN_CAPACITY_COLUMN: [low for low, _ in bounds],
+        MAX_CAPACITY_COLUMN: [high for _, high in bounds]
+    })
+
+
+# 카탈로그 파일
+#  - 장비/용어/구성 데이터는 data/catalog.json 에 두고, 프로세스당 한 번 읽어 모든 세션이 공유한다.
+#  - version 은 파일 내용의 해시라서 내용이 바뀌면 검색 색인/캐시가 자동으로 새로 만들어진다.
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "catalog.json")
+SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Catalog:
+    """읽기 전용 카탈로그. 여러 세션이 같은 객체를 보므로 내용을 수정하지 말 것."""
+    version: str
+    equipment_comparison: dict
+    equipment_specs: pd.DataFrame
+    detailed_equipment: dict
+    encryption_comparison: dict
+    glossary: dict
+    network_configs: dict
+
+
+def load_catalog(path: str = CATALOG_PATH) -> Catalog:
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = json.loads(raw)
+    if data.get("schema_version") != SCHEMA_VERSION:
+        raise ValueError(f"지원하지 않는 카탈로그 형식입니다: schema_version={data.get('schema_version')}")
+
+    return Catalog(
+        version=hashlib.sha256(raw).hexdigest()[:16],
+        equipment_comparison=data["equipment_comparison"],
+        equipment_specs=add_capacity_columns(pd.DataFrame(data["equipment_specs"])),
+        detailed_equipment=data["detailed_equipment"],
+        encryption_comparison=data["encryption_comparison"],
+        glossary=data["glossary"],
+        network_configs=data["network_configs"]
+    )
+
+
+# 핫 리로드
+#  - 백그라운드 스레드가 파일의 (mtime, 크기) 를 주기적으로 확인하고, 바뀌면 카탈로그와
+#    파생 데이터(build 결과)를 새로 만든 뒤 참조 하나를 바꿔 끼운다.
+#  - 읽는 쪽은 current() 로 완성된 묶음만 받으므로 만들다 만 상태를 볼 일이 없다.
+#  - 새 파일을 읽거나 묶음을 만들다 실패하면 (쓰는 중, 형식 오류, build 예외 등) 오류를 last_error 에
+#    남기고 기존 묶음을 계속 쓴다. 감시 스레드는 죽지 않고 다음 주기에 다시 확인한다.
+RELOAD_INTERVAL = 2.0
+
+
+class CatalogWatcher:
+    def __init__(self, build=lambda catalog: catalog, path: str = CATALOG_PATH, interval: float = RELOAD_INTERVAL):
+        """build: Catalog 를 받아 화면에서 쓸 묶음(색인 등)을 만드는 함수."""
+        self.path = path
+        self.interval = interval
+        self.last_error = None
+        self._build = build
+        self._stamp = self._file_stamp()
+        catalog = load_catalog(path)
+        self._state = (catalog.version, build(catalog))
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._watch, name="catalog-watcher", daemon=True)
+        self._thread.start()
+
+    @property
+    def version(self) -> str:
+        return self._state[0]
+
+    def current(self):
+        return self._state[1]
+
+    def _file_stamp(self):
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def check(self) -> bool:
+        """파일이 바뀌었으면 다시 만들어 교체한다. 교체했으면 True."""
+        with self._lock:
+            try:
+                stamp = self._file_stamp()
+                if stamp == self._stamp:
+                    return False
+                catalog = load_catalog(self.path)
+                self._stamp = stamp
+                if catalog.version == self.version:
+                    # 잘못 쓴 파일을 원래 내용으로 되돌린 경우: 지금 묶음이 곧 파일 내용이다
+                    self.last_error = None
+                    return False
+                state = (catalog.version, self._build(catalog))
+            except Exception as e:
+                self.last_error = e
+                return False
+            self._state = state
+            self.last_error = None
+            return True
+
+    def _watch(self):
+        while not self._stopped.wait(self.interval):
+            self.check()
+
+    def stop(self):
+        self._stopped.set()
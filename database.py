@@ -1,6 +1,8 @@
+import json
 import os
-from datetime import datetime
-from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime, Text
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime, Text, UniqueConstraint
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 # 1. DB URL을 환경변수에서 찾되, 없으면 sqlite로 fallback
@@ -23,6 +25,18 @@ class SearchLog(Base):
     summary = Column(Text)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+#    - 웹 서치 응답 캐시: (정규화된 검색어, 국가, 날짜) 당 한 행. 재시작 후에도, 여러 서버 프로세스 간에도 공유된다.
+class WebSearchCache(Base):
+    __tablename__ = "web_search_cache"
+    __table_args__ = (UniqueConstraint("query", "country", "search_date"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    query = Column(String(500), nullable=False)
+    country = Column(String(8), nullable=False)
+    search_date = Column(String(10), nullable=False)
+    results = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
 # 4. 테이블이 없으면 생성
 def init_db():
     Base.metadata.create_all(bind=engine)
@@ -52,3 +66,37 @@ def get_recent_logs(limit: int = 20):
         return rows
     finally:
         session.close()
+
+def get_cached_web_search(query: str, country: str, search_date: str, max_age_seconds: int):
+    """max_age_seconds 이내에 저장된 결과가 있으면 반환, 없으면 None."""
+    session = get_session()
+    try:
+        row = (
+            session.query(WebSearchCache)
+            .filter_by(query=query, country=country, search_date=search_date)
+            .filter(WebSearchCache.created_at >= datetime.utcnow() - timedelta(seconds=max_age_seconds))
+            .first()
+        )
+        return json.loads(row.results) if row else None
+    finally:
+        session.close()
+
+def save_web_search(query: str, country: str, search_date: str, results):
+    session = get_session()
+    try:
+        row = (
+            session.query(WebSearchCache)
+            .filter_by(query=query, country=country, search_date=search_date)
+            .first()
+        )
+        if row is None:
+            row = WebSearchCache(query=query, country=country, search_date=search_date)
+            session.add(row)
+        row.results = json.dumps(results, ensure_ascii=False)
+        row.created_at = datetime.utcnow()
+        session.commit()
+    except IntegrityError:
+        # 다른 프로세스가 같은 키를 먼저 저장함 — 그 결과를 그대로 쓴다
+        session.rollback()
+    finally:
+        session.close()
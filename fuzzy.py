@@ -0,0 +1,69 @@
+def levenshtein(a: str, b: str, limit: int = None) -> int:
+    """편집 거리. limit 을 주면 limit 을 넘는 순간 limit + 1 을 반환하고 멈춘다."""
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def max_typos(word: str) -> int:
+    """짧은 단어일수록 허용 오타 수를 줄인다 (4글자 이하 1개, 그 외 2개)."""
+    return 1 if len(word) <= 4 else 2
+
+
+class BKTree:
+    """편집 거리 기반 BK-tree. 삼각 부등식으로 대부분의 가지를 건너뛰므로
+    전체 어휘와 일일이 거리를 재지 않고도 오타 후보를 찾는다."""
+
+    def __init__(self, words=()):
+        self._root = None
+        self.size = 0
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str):
+        if self._root is None:
+            self._root = (word, {})
+            self.size = 1
+            return
+
+        node_word, children = self._root
+        while True:
+            distance = levenshtein(word, node_word)
+            if distance == 0:
+                return
+            if distance not in children:
+                children[distance] = (word, {})
+                self.size += 1
+                return
+            node_word, children = children[distance]
+
+    def search(self, word: str, max_distance: int):
+        """max_distance 이내의 단어를 [(거리, 단어), ...] 로 가까운 순서대로 반환."""
+        if self._root is None:
+            return []
+
+        found = []
+        stack = [self._root]
+        while stack:
+            node_word, children = stack.pop()
+            distance = levenshtein(word, node_word)
+            if distance <= max_distance:
+                found.append((distance, node_word))
+            low, high = distance - max_distance, distance + max_distance
+            stack.extend(child for d, child in children.items() if low <= d <= high)
+        return sorted(found)
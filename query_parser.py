@@ -0,0 +1,104 @@
+import re
+
+# 불리언/구문 검색어 파서
+#  - PTN AND CES NOT APN-20D, (OTN OR DWDM) 백본, "50ms 절체"
+#  - 연산자는 대문자 AND / OR / NOT, 구문은 큰따옴표. 연산자 없이 이어 쓴 단어는 AND.
+#  - 결과 트리: ("word", 단어) | ("phrase", 구문) | ("and", [..]) | ("or", [..]) | ("not", 노드)
+OPERATORS = ("AND", "OR", "NOT")
+_QUERY_TOKEN_RE = re.compile(r'"[^"]*"?|\(|\)|[^\s()"]+')
+
+
+def lex_query(query: str):
+    return _QUERY_TOKEN_RE.findall(query)
+
+
+def is_boolean_query(query: str) -> bool:
+    return any(
+        token in OPERATORS or token.startswith('"') or token in ("(", ")")
+        for token in lex_query(query)
+    )
+
+
+class _Parser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self):
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def parse_or(self):
+        children = [self.parse_and()]
+        while self.peek() == "OR":
+            self.take()
+            children.append(self.parse_and())
+        children = [child for child in children if child is not None]
+        if not children:
+            return None
+        return children[0] if len(children) == 1 else ("or", children)
+
+    def parse_and(self):
+        children = []
+        while self.peek() not in (None, "OR", ")"):
+            if self.peek() == "AND":
+                self.take()
+                continue
+            node = self.parse_not()
+            if node is not None:
+                children.append(node)
+        if not children:
+            return None
+        return children[0] if len(children) == 1 else ("and", children)
+
+    def parse_not(self):
+        if self.peek() == "NOT":
+            self.take()
+            # 입력 중인 "PTN NOT", "NOT OR CES" 처럼 뒤에 피연산자가 없는 NOT 은 버린다
+            if self.peek() in (None, "AND", "OR", ")"):
+                return None
+            node = self.parse_not()
+            return ("not", node) if node is not None else None
+        return self.parse_primary()
+
+    def parse_primary(self):
+        token = self.take()
+        if token is None:
+            return None
+        if token == "(":
+            node = self.parse_or()
+            if self.peek() == ")":
+                self.take()
+            return node
+        if token == ")":
+            return None
+        if token.startswith('"'):
+            text = token.strip('"').strip()
+            return ("phrase", text) if text else None
+        return ("word", token)
+
+
+def parse_query(query: str):
+    """검색어를 질의 트리로 바꾼다. 빈 검색어면 None. 괄호/따옴표 짝이 안 맞아도 최대한 해석한다."""
+    parser = _Parser(lex_query(query))
+    node = parser.parse_or()
+    # 짝 없는 ")" 뒤에 남은 토큰도 AND 로 이어 붙인다
+    while parser.peek() is not None:
+        parser.take()
+        rest = parser.parse_or()
+        if rest is not None:
+            node = rest if node is None else ("and", [node, rest])
+    return node
+
+
+def positive_terms(node):
+    """NOT 아래를 제외한 단어/구문 목록 (점수 계산용)."""
+    if node is None or node[0] == "not":
+        return []
+    if node[0] in ("word", "phrase"):
+        return [node[1]]
+    return [term for child in node[1] for term in positive_terms(child)]
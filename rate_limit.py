@@ -0,0 +1,110 @@
+import threading
+import time
+from contextlib import contextmanager
+
+
+class RateLimitTimeout(Exception):
+    """max_wait 안에 호출 자리를 얻지 못함. wait: 그때 예상되던 대기 시간(초)."""
+
+    def __init__(self, wait: float):
+        super().__init__(f"rate limit: about {wait:.0f}s wait")
+        self.wait = wait
+
+
+class TokenBucket:
+    """capacity 만큼 모아 둘 수 있고 초당 rate 만큼 다시 차는 버킷. 잠금은 호출하는 쪽에서 잡는다."""
+
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.level = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount 를 꺼낼 수 있을 때까지 남은 초. 버킷보다 큰 요청은 가득 찰 때까지만 기다린다."""
+        self._refill(now)
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing / self.rate)
+
+    def take(self, amount: float):
+        # 큰 요청은 잔량을 음수로 만들어, 그만큼 다음 요청들이 기다리게 한다
+        self.level -= amount
+
+
+class RateLimiter:
+    """분당 요청 수 / 분당 토큰 수 버킷과 동시 실행 수 상한을 함께 건다.
+
+    토큰 수는 호출 전에는 추정치로 빼 두고, 응답의 실제 사용량을 알게 되면 release 에서 보정한다.
+    동시 실행 자리를 기다리는 시간은 최근 호출들의 평균 소요 시간(처음에는 call_seconds)으로 어림한다.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int, max_in_flight: int,
+                 call_seconds: float = 10.0):
+        self.max_in_flight = max_in_flight
+        self._avg_duration = call_seconds
+        self._requests = TokenBucket(requests_per_minute, requests_per_minute / 60)
+        self._tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60)
+        self._in_flight = 0
+        self._waiting = 0
+        self._cond = threading.Condition()
+
+    def _bucket_wait(self, tokens: float, now: float) -> float:
+        return max(self._requests.wait_time(1, now), self._tokens.wait_time(tokens, now))
+
+    def _in_flight_wait(self, queued_ahead: int) -> float:
+        """동시 실행 자리가 날 때까지의 예상 시간. 앞의 대기자들이 max_in_flight 개씩 평균 소요 시간만큼 쓴다고 본다."""
+        if self._in_flight < self.max_in_flight:
+            return 0.0
+        return (queued_ahead // self.max_in_flight + 1) * self._avg_duration
+
+    def wait_estimate(self, tokens: float) -> float:
+        """지금 요청하면 대략 몇 초 기다려야 하는지 (버킷 대기와 동시 실행 자리 대기 중 긴 쪽)."""
+        with self._cond:
+            return max(self._bucket_wait(tokens, time.monotonic()), self._in_flight_wait(self._waiting))
+
+    def acquire(self, tokens: float, max_wait: float):
+        """자리가 날 때까지 기다린다. max_wait 안에 안 되면 RateLimitTimeout."""
+        deadline = time.monotonic() + max_wait
+        with self._cond:
+            self._waiting += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    wait = self._bucket_wait(tokens, now)
+                    if wait == 0 and self._in_flight < self.max_in_flight:
+                        self._requests.take(1)
+                        self._tokens.take(tokens)
+                        self._in_flight += 1
+                        return
+                    remaining = deadline - now
+                    if remaining <= 0 or wait > remaining:
+                        # 동시 실행 자리만 막힌 경우 wait 는 0 이므로 자리 대기 예상치도 함께 본다
+                        raise RateLimitTimeout(max(wait, self._in_flight_wait(self._waiting - 1)))
+                    self._cond.wait(wait or remaining)
+            finally:
+                self._waiting -= 1
+
+    def release(self, tokens: float, used_tokens: float = None, duration: float = None):
+        """used_tokens: 실제 토큰 사용량, duration: 호출에 걸린 초 (평균 소요 시간에 반영)."""
+        with self._cond:
+            self._in_flight -= 1
+            if used_tokens is not None:
+                self._tokens.take(used_tokens - tokens)
+            if duration is not None:
+                self._avg_duration = 0.8 * self._avg_duration + 0.2 * duration
+            self._cond.notify_all()
+
+    @contextmanager
+    def limit(self, tokens: float, max_wait: float):
+        """with limiter.limit(추정 토큰, 최대 대기) as usage: ... usage["tokens"] = 실제 사용량"""
+        self.acquire(tokens, max_wait)
+        usage = {"tokens": None}
+        started = time.monotonic()
+        try:
+            yield usage
+        finally:
+            self.release(tokens, usage["tokens"], time.monotonic() - started)
@@ -0,0 +1,679 @@
+import functools
+import math
+import operator
+import re
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from fuzzy import BKTree, max_typos
+from query_parser import OPERATORS, is_boolean_query, lex_query, parse_query, positive_terms
+from synonyms import compile_synonyms
+from tokenizer import (
+    chosung_runs, chosung_tokens, is_chosung_query, is_hangul,
+    normalize, phrase_words, tokenize, tokenize_chosung_query, tokenize_query
+)
+
+
+SNIPPET_WIDTH = 40
+_MARKDOWN_SPECIAL_RE = re.compile(r"([\\`*_~\[\]<>#|$])")
+
+
+def _escape_markdown(text: str) -> str:
+    return _MARKDOWN_SPECIAL_RE.sub(r"\\\1", text)
+
+
+def _merge_spans(spans):
+    merged = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+# 1. 색인 대상 문서
+@dataclass
+class Document:
+    doc_id: int
+    kind: str
+    title: str
+    category: str
+    summary: str
+    fields: dict
+    field_summaries: dict = field(default_factory=dict)
+    facets: dict = field(default_factory=dict)
+
+    def to_result(self, matched_fields):
+        content = self.summary
+        if "제목" not in matched_fields:
+            for name in self.fields:
+                if name in matched_fields and name in self.field_summaries:
+                    content = self.field_summaries[name]
+                    break
+        return {
+            "유형": self.kind,
+            "제목": self.title,
+            "내용": content,
+            "카테고리": self.category
+        }
+
+    def snippet(self, matched_fields, width: int = SNIPPET_WIDTH):
+        """일치 구간을 굵게 표시한 짧은 발췌문 (마크다운). 제목만 일치했으면 None."""
+        for name in self.fields:
+            if name == "제목" or not matched_fields.get(name):
+                continue
+            text = self.fields[name]
+            spans = _merge_spans(matched_fields[name])
+            start = max(0, spans[0][0] - width)
+            end = min(len(text), spans[0][0] + width)
+
+            parts = ["…" if start > 0 else ""]
+            cursor = start
+            for span_start, span_end in spans:
+                if span_start >= end:
+                    break
+                span_end = min(span_end, end)
+                parts.append(_escape_markdown(text[cursor:span_start]))
+                parts.append(f"**{_escape_markdown(text[span_start:span_end])}**")
+                cursor = span_end
+            parts.append(_escape_markdown(text[cursor:end]))
+            parts.append("…" if end < len(text) else "")
+            return f"{name}: " + "".join(parts).replace("\n", " / ")
+        return None
+
+
+def build_documents(detailed_equipment, glossary, equipment_comparison, equipment_classes=None):
+    """equipment_classes: {모델명: 분류("POTN"/"PTN")} — 분류 패싯에 쓴다."""
+    documents = []
+    equipment_classes = equipment_classes or {}
+
+    for model, specs in detailed_equipment.items():
+        documents.append(Document(
+            doc_id=len(documents),
+            kind="장비",
+            title=model,
+            category="장비 상세",
+            summary=f"{specs['용량']} | {specs['적용분야']}",
+            fields={
+                "제목": model,
+                "특징": "\n".join(specs.get("특징", []))
+            },
+            facets={"분류": equipment_classes.get(model)}
+        ))
+
+    for term, info in glossary.items():
+        documents.append(Document(
+            doc_id=len(documents),
+            kind="용어",
+            title=term,
+            category="용어 사전",
+            summary=info['쉬운설명'],
+            fields={
+                "제목": term,
+                "설명": info['설명'],
+                "쉬운설명": info['쉬운설명']
+            }
+        ))
+
+    for tech, details in equipment_comparison.items():
+        text_fields = {key: value for key, value in details.items() if isinstance(value, str)}
+        documents.append(Document(
+            doc_id=len(documents),
+            kind="기술",
+            title=tech,
+            category="기술 비교",
+            summary=details['주요용도'],
+            fields={"제목": tech, **text_fields},
+            field_summaries={key: f"{key}: {value}" for key, value in text_fields.items()}
+        ))
+
+    return documents
+
+
+# 2. 랭킹 파라미터 (필드 가중 BM25)
+#    - 모델명/용어명(제목) 일치를 가장 크게, 쉬운설명 일치를 가장 작게 본다.
+BM25_K1 = 1.2
+BM25_B = 0.75
+ALIAS_FIELD = "별칭"
+FIELD_WEIGHTS = {
+    "제목": 3.0,
+    "쉬운설명": 0.5,
+    ALIAS_FIELD: 0.3
+}
+DEFAULT_FIELD_WEIGHT = 1.0
+
+
+FUZZY_KINDS = ("장비", "용어")
+FACETS = ("유형", "분류")
+
+
+def _freeze_postings(postings):
+    """{term: {(doc_id, field): [(start, end), ...]}} → {term: [(doc_id, field, spans), ...]}"""
+    return {
+        term: sorted((doc_id, name, tuple(spans)) for (doc_id, name), spans in entries.items())
+        for term, entries in postings.items()
+    }
+
+
+# 3. 정렬된 doc_id 목록 연산 (불리언 검색)
+def intersect_postings(a, b):
+    """두 정렬된 doc_id 목록의 교집합. 긴 목록은 √n 간격의 건너뛰기 포인터로 지나간다."""
+    if len(a) > len(b):
+        a, b = b, a
+    skip = int(math.sqrt(len(b))) or 1
+    result = []
+    j = 0
+    for doc_id in a:
+        while j + skip < len(b) and b[j + skip] <= doc_id:
+            j += skip
+        while j < len(b) and b[j] < doc_id:
+            j += 1
+        if j == len(b):
+            break
+        if b[j] == doc_id:
+            result.append(doc_id)
+    return result
+
+
+def union_postings(a, b):
+    result = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i] == b[j]:
+            result.append(a[i])
+            i += 1
+            j += 1
+        elif a[i] < b[j]:
+            result.append(a[i])
+            i += 1
+        else:
+            result.append(b[j])
+            j += 1
+    return result + a[i:] + b[j:]
+
+
+def difference_postings(a, b):
+    """a 에서 b 를 뺀다. b 쪽은 건너뛰기 포인터로 따라간다."""
+    skip = int(math.sqrt(len(b))) or 1
+    result = []
+    j = 0
+    for doc_id in a:
+        while j + skip < len(b) and b[j + skip] <= doc_id:
+            j += skip
+        while j < len(b) and b[j] < doc_id:
+            j += 1
+        if j == len(b) or b[j] != doc_id:
+            result.append(doc_id)
+    return result
+
+
+def _merge_matches(target, source, doc_ids=None):
+    for doc_id, fields in source.items():
+        if doc_ids is not None and doc_id not in doc_ids:
+            continue
+        merged = target.setdefault(doc_id, {})
+        for name, spans in fields.items():
+            merged.setdefault(name, []).extend(spans)
+    return target
+
+
+def _chain_spans(left, right, max_gap):
+    """left 의 각 구간 바로 뒤(max_gap 글자 이내)에 right 구간이 이어지는 경우를 합친다."""
+    starts = {}
+    for start, end in right:
+        starts.setdefault(start, []).append(end)
+    chained = []
+    for start, end in left:
+        for gap in range(max_gap + 1):
+            for next_end in starts.get(end + gap, []):
+                chained.append((start, next_end))
+    return chained
+
+
+# 4. 역색인 (term → [(doc_id, field, 원문 위치 목록), ...])
+class SearchIndex:
+    def __init__(self, documents, synonyms=()):
+        """synonyms: synonyms.compile_synonyms() 결과."""
+        self.documents = documents
+
+        self.kind_doc_ids = {}
+        for doc in documents:
+            self.kind_doc_ids.setdefault(doc.kind, set()).add(doc.doc_id)
+        self._all_doc_ids = [doc.doc_id for doc in documents]
+
+        # 패싯 비트셋: {패싯: {값: doc_id 비트마스크}} — 건수 = popcount(결과 & 패싯)
+        self.facet_bits = {facet: {} for facet in FACETS}
+        for doc in documents:
+            for facet, value in {"유형": doc.kind, **doc.facets}.items():
+                if value is not None:
+                    values = self.facet_bits.setdefault(facet, {})
+                    values[value] = values.get(value, 0) | (1 << doc.doc_id)
+
+        # 오타 교정 대상: 장비 모델명 + 용어 사전 표제어
+        self._fuzzy_titles = {
+            doc.title.lower(): doc.title
+            for doc in documents if doc.kind in FUZZY_KINDS
+        }
+        self._fuzzy_tree = BKTree(self._fuzzy_titles)
+
+        postings = {}
+        chosung_postings = {}
+        self.field_lengths = {}
+        self.chosung_runs = {}
+        for doc in documents:
+            doc_terms = set()
+            for name, text in doc.fields.items():
+                key = (doc.doc_id, name)
+                tokens = tokenize(text)
+                self.field_lengths[key] = len(tokens)
+                for token in tokens:
+                    postings.setdefault(token.term, {}).setdefault(key, []).append((token.start, token.end))
+                    doc_terms.add(token.term)
+
+                # 초성 분해는 여기서 한 번만 한다 (검색 시에는 색인 조회 + 후보 검증만)
+                runs = chosung_runs(text)
+                if runs:
+                    self.chosung_runs[key] = runs
+                for token in chosung_tokens(runs):
+                    chosung_postings.setdefault(token.term, {}).setdefault(key, []).append((token.start, token.end))
+
+            # 동의어: 묶음 중 한 단어라도 문서에 있으면 묶음 전체를 "별칭" 필드로 색인한다.
+            # 원문 위치가 없으므로 (0, 0) 을 넣고, 스니펫에서는 건너뛴다.
+            alias_terms = set()
+            for group in synonyms:
+                if any(doc_terms.issuperset(member) for member in group):
+                    alias_terms.update(term for member in group for term in member)
+            if alias_terms:
+                key = (doc.doc_id, ALIAS_FIELD)
+                self.field_lengths[key] = len(alias_terms)
+                for term in alias_terms:
+                    postings.setdefault(term, {})[key] = [(0, 0)]
+
+        self.postings = _freeze_postings(postings)
+        self.chosung_postings = _freeze_postings(chosung_postings)
+        self._terms = sorted(self.postings)
+
+        # 필드별 평균 길이 (BM25 길이 정규화용)
+        totals = {}
+        for (_, name), length in self.field_lengths.items():
+            count, total = totals.get(name, (0, 0))
+            totals[name] = (count + 1, total + length)
+        self.avg_field_lengths = {
+            name: (total / count) if count else 0.0
+            for name, (count, total) in totals.items()
+        }
+
+    @classmethod
+    def build(cls, detailed_equipment, glossary, equipment_comparison, equipment_classes=None):
+        return cls(
+            build_documents(detailed_equipment, glossary, equipment_comparison, equipment_classes),
+            compile_synonyms()
+        )
+
+    def _lookup(self, term, chosung=False):
+        """색인어의 posting 을 {doc_id: {field: [(start, end), ...]}} 로 합친다.
+
+        한글 n-gram 과 초성은 정확히 일치하는 색인어만, 영숫자 토큰은 term 으로 시작하는
+        모든 색인어("opn" → "opn-3000", "opn-1000", ...)를 본다.
+        """
+        matches = {}
+        postings = self.chosung_postings if chosung else self.postings
+        if chosung or is_hangul(term):
+            terms = [term] if term in postings else []
+        else:
+            terms = []
+            i = bisect_left(self._terms, term)
+            while i < len(self._terms) and self._terms[i].startswith(term):
+                terms.append(self._terms[i])
+                i += 1
+        for indexed in terms:
+            for doc_id, name, spans in postings[indexed]:
+                if name == ALIAS_FIELD and indexed != term:
+                    # 별칭은 정확히 같은 단어만 ("otn" 이 "otnsec" 별칭까지 끌어오지 않도록)
+                    continue
+                # 접두사 일치는 입력한 부분만 강조한다 ("opn" → "**OPN**-3000")
+                matches.setdefault(doc_id, {}).setdefault(name, []).extend(
+                    (start, min(end, start + len(term))) for start, end in spans
+                )
+        return matches
+
+    def _match(self, terms, kinds=None, chosung=False):
+        """모든 질의 토큰을 포함하는 문서와, 토큰별 {doc_id: {field: spans}} 를 반환."""
+        hits_by_term = {}
+        candidates = None
+        if kinds is not None:
+            candidates = set().union(*(self.kind_doc_ids.get(kind, set()) for kind in kinds))
+        for term in sorted(terms, key=len, reverse=True):
+            hits = self._lookup(term, chosung)
+            hits_by_term[term] = hits
+            candidates = set(hits) if candidates is None else candidates & set(hits)
+            if not candidates:
+                return set(), hits_by_term
+        return candidates or set(), hits_by_term
+
+    def _chosung_fields(self, doc_id, fields, consonants):
+        """bigram 후보 중 초성 문자열이 실제로 연속해서 나오는 필드와 그 원문 위치."""
+        matched = {}
+        for name in fields:
+            for run, positions in self.chosung_runs.get((doc_id, name), []):
+                start = run.find(consonants)
+                while start != -1:
+                    end = start + len(consonants) - 1
+                    matched.setdefault(name, []).append((positions[start], positions[end] + 1))
+                    start = run.find(consonants, start + 1)
+        return matched
+
+    def match(self, query: str, kinds=None):
+        """모든 질의 토큰을 포함하는 문서를 {doc_id: {일치한 필드: [(start, end), ...]}} 로 반환.
+        검색어가 초성만으로 이루어져 있으면("ㅈㅇㅎㅅ") 초성 색인을,
+        AND/OR/NOT/큰따옴표가 있으면 불리언·구문 검색을 쓴다."""
+        return self._retrieve(query, kinds)[0]
+
+    def _retrieve(self, query: str, kinds=None, scoring=False):
+        """match/score 공통 검색. 반환: (match 결과, 점수 계산용 {토큰: {doc_id: {field: spans}}}).
+        scoring=True 일 때만 점수에만 쓰는 토큰(한글 trigram 가산점 등)을 추가로 조회한다."""
+        if is_boolean_query(query):
+            # 불리언 검색은 NOT 이 아닌 단어/구문의 토큰으로 점수를 매긴다
+            hits_by_term = {} if scoring else None
+            doc_ids, matched = self._evaluate(parse_query(query), hits_by_term)
+            if kinds is not None:
+                allowed = set().union(*(self.kind_doc_ids.get(kind, set()) for kind in kinds))
+                doc_ids = [doc_id for doc_id in doc_ids if doc_id in allowed]
+            return {doc_id: matched.get(doc_id, {}) for doc_id in doc_ids}, hits_by_term or {}
+
+        if is_chosung_query(query):
+            required = tokenize_chosung_query(query)
+            candidates, hits_by_term = self._match(required, kinds, chosung=True)
+            consonants = "".join(query.split())
+            matched = {}
+            for doc_id in candidates:
+                fields = set().union(*(hits[doc_id] for hits in hits_by_term.values()))
+                fields = self._chosung_fields(doc_id, fields, consonants)
+                if fields:
+                    matched[doc_id] = fields
+            return matched, hits_by_term
+
+        required, boost = tokenize_query(query)
+        if not required:
+            return {}, {}
+
+        candidates, hits_by_term = self._match(required, kinds)
+
+        # 모든 토큰이 한 필드에 함께 나온 경우 그 필드를, 아니면 토큰별 필드의 합집합을 쓴다.
+        matched = {}
+        for doc_id in candidates:
+            field_sets = [set(hits[doc_id]) for hits in hits_by_term.values()]
+            names = set.intersection(*field_sets) or set.union(*field_sets)
+            matched[doc_id] = {
+                name: [span for hits in hits_by_term.values() for span in hits[doc_id].get(name, [])]
+                for name in names
+            }
+        if scoring:
+            for term in boost:
+                hits_by_term[term] = self._lookup(term)
+        return matched, hits_by_term
+
+    def _word_spans(self, word):
+        """구문 검색용: 한 단어가 나오는 위치 {doc_id: {field: [(start, end), ...]}}.
+        4글자 이상 한글은 bigram 위치를 한 글자씩 겹쳐 이어 붙여 찾는다."""
+        if not is_hangul(word) or len(word) <= 3:
+            return self._lookup(word)
+
+        occurrences = self._lookup(word[:2])
+        for i in range(1, len(word) - 1):
+            bigram = self._lookup(word[i:i + 2])
+            next_occurrences = {}
+            for doc_id, fields in occurrences.items():
+                for name, spans in fields.items():
+                    # "전용회선" 의 "전용"(0,2) 뒤에는 "용회"(1,3) 가 온다: 다음 시작 = 이전 끝 - 1
+                    shifted = [(start, end - 1) for start, end in spans]
+                    chained = _chain_spans(shifted, bigram.get(doc_id, {}).get(name, []), 0)
+                    if chained:
+                        next_occurrences.setdefault(doc_id, {})[name] = chained
+            occurrences = next_occurrences
+        return occurrences
+
+    def _match_phrase(self, phrase):
+        """단어들이 순서대로 (공백/기호 한 글자 이내로) 붙어 나오는 필드와 그 위치."""
+        words = phrase_words(phrase)
+        if not words:
+            return {}
+
+        # 별칭 필드는 원문 위치가 없으므로 구문 검색 대상이 아니다
+        occurrences = {
+            doc_id: {name: spans for name, spans in fields.items() if name != ALIAS_FIELD}
+            for doc_id, fields in self._word_spans(words[0]).items()
+        }
+        for word in words[1:]:
+            following = self._word_spans(word)
+            next_occurrences = {}
+            for doc_id, fields in occurrences.items():
+                for name, spans in fields.items():
+                    chained = _chain_spans(spans, following.get(doc_id, {}).get(name, []), 1)
+                    if chained:
+                        next_occurrences.setdefault(doc_id, {})[name] = chained
+            occurrences = next_occurrences
+        return occurrences
+
+    def _evaluate(self, node, hits_by_term=None):
+        """질의 트리를 정렬된 posting 목록 연산으로 평가. 반환: (doc_id 목록, {doc_id: {field: spans}})
+        hits_by_term 을 주면 NOT 아래가 아닌 단어/구문의 토큰별 hits 를 함께 모은다 (점수 계산용)."""
+        if node is None:
+            return [], {}
+        kind = node[0]
+        scoring = hits_by_term is not None
+        if kind == "word":
+            matched, word_hits = self._retrieve(node[1], scoring=scoring)
+            if scoring:
+                hits_by_term.update(word_hits)
+            return sorted(matched), matched
+        if kind == "phrase":
+            matched = self._match_phrase(node[1])
+            if scoring:
+                required, boost = tokenize_query(node[1])
+                for term in required + boost:
+                    if term not in hits_by_term:
+                        hits_by_term[term] = self._lookup(term)
+            return sorted(matched), matched
+        if kind == "not":
+            doc_ids, _ = self._evaluate(node[1])
+            return difference_postings(self._all_doc_ids, doc_ids), {}
+        if kind == "or":
+            doc_ids, matched = [], {}
+            for child in node[1]:
+                child_ids, child_matched = self._evaluate(child, hits_by_term)
+                doc_ids = union_postings(doc_ids, child_ids)
+                _merge_matches(matched, child_matched)
+            return doc_ids, matched
+
+        # and: 짧은 목록부터 교집합, NOT 자식은 마지막에 차집합
+        positives = [self._evaluate(child, hits_by_term) for child in node[1] if child[0] != "not"]
+        negatives = [self._evaluate(child[1])[0] for child in node[1] if child[0] == "not"]
+        positives.sort(key=lambda evaluated: len(evaluated[0]))
+        doc_ids = positives[0][0] if positives else self._all_doc_ids
+        for child_ids, _ in positives[1:]:
+            doc_ids = intersect_postings(doc_ids, child_ids)
+        for child_ids in negatives:
+            doc_ids = difference_postings(doc_ids, child_ids)
+        matched = {}
+        selected = set(doc_ids)
+        for _, child_matched in positives:
+            _merge_matches(matched, child_matched, selected)
+        return doc_ids, matched
+
+    def score(self, query: str, kinds=None):
+        """{doc_id: score} 반환. 토큰마다 가중 BM25 가 가장 높은 필드 하나만 반영해
+        필드가 많은 문서가 점수를 부풀리지 않도록 한다. 한글 trigram 은 가산점으로만 쓴다."""
+        return self._bm25(*self._retrieve(query, kinds, scoring=True))
+
+    def _bm25(self, candidates, hits_by_term):
+        total_docs = len(self.documents)
+
+        scores = {}
+        for hits in hits_by_term.values():
+            df = len(hits)
+            idf = math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+            for doc_id in candidates:
+                best = 0.0
+                for name, spans in hits.get(doc_id, {}).items():
+                    tf = len(spans)
+                    avg_length = self.avg_field_lengths.get(name) or 1.0
+                    length = self.field_lengths.get((doc_id, name), 0)
+                    norm = 1 - BM25_B + BM25_B * length / avg_length
+                    field_score = idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
+                    best = max(best, FIELD_WEIGHTS.get(name, DEFAULT_FIELD_WEIGHT) * field_score)
+                scores[doc_id] = scores.get(doc_id, 0.0) + best
+        return scores
+
+    def hits(self, query: str, rank: bool = False, kinds=None):
+        """검색 결과를 SearchHits 로 반환. rank=True 이면 BM25 점수 내림차순,
+        아니면 장비→용어→기술 순. kinds 를 주면 해당 유형("장비", "용어", "기술")의 문서만 찾는다."""
+        # 검색과 점수 계산이 같은 토큰 조회 결과를 쓴다 (색인을 두 번 훑지 않도록)
+        matched, hits_by_term = self._retrieve(query, kinds, scoring=rank)
+        if rank:
+            scores = self._bm25(matched, hits_by_term)
+            order = sorted(matched, key=lambda doc_id: (-scores.get(doc_id, 0.0), doc_id))
+        else:
+            order = sorted(matched)
+        return SearchHits(self, tuple(order), matched)
+
+    def search(self, query: str, rank: bool = False, kinds=None):
+        """검색 결과 dict 목록 전체."""
+        return self.hits(query, rank, kinds).all()
+
+    def _result(self, doc_id, matched_fields):
+        doc = self.documents[doc_id]
+        result = doc.to_result(matched_fields)
+        result["스니펫"] = doc.snippet(matched_fields)
+        result["매칭"] = [
+            (name, start, end)
+            for name, spans in matched_fields.items() if name in doc.fields
+            for start, end in _merge_spans(spans)
+        ]
+        return result
+
+    def suggest(self, query: str, limit: int = 3):
+        """오타가 섞인 검색어에 대한 "혹시 이것을 찾으셨나요?" 후보 (모델명/용어명)."""
+        word = query.strip().lower()
+        if not word:
+            return []
+        candidates = self._fuzzy_tree.search(word, max_typos(word))
+        return [self._fuzzy_titles[title] for distance, title in candidates if distance > 0][:limit]
+
+
+class SearchHits:
+    """일치한 문서 id 의 순서와 일치 구간만 들고 있는 검색 결과.
+
+    결과 dict(스니펫 포함)는 page() 로 요청한 페이지 분량만 만든다.
+    """
+
+    def __init__(self, index, order, matched):
+        self._index = index
+        self.order = order
+        self.matched = matched
+        self.bits = 0
+        for doc_id in order:
+            self.bits |= 1 << doc_id
+
+    def facet_counts(self):
+        """{패싯: {값: 건수}} — 결과 비트셋과 패싯 비트셋의 교집합 크기."""
+        counts = {}
+        for facet, values in self._index.facet_bits.items():
+            counts[facet] = {
+                value: (self.bits & bits).bit_count()
+                for value, bits in values.items()
+                if self.bits & bits
+            }
+        return counts
+
+    def refine(self, filters):
+        """filters: {패싯: [값, ...]}. 같은 패싯 안의 값은 OR, 패싯끼리는 AND.
+        새로 검색하지 않고 이미 구한 결과 비트셋에 교집합만 적용한다."""
+        mask = self.bits
+        for facet, values in filters.items():
+            if values:
+                facet_bits = self._index.facet_bits.get(facet, {})
+                mask &= functools.reduce(operator.or_, (facet_bits.get(value, 0) for value in values), 0)
+        if mask == self.bits:
+            return self
+        order = tuple(doc_id for doc_id in self.order if mask >> doc_id & 1)
+        return SearchHits(self._index, order, self.matched)
+
+    @property
+    def total(self) -> int:
+        return len(self.order)
+
+    def __len__(self):
+        return self.total
+
+    def page_count(self, page_size: int) -> int:
+        return max(1, math.ceil(self.total / page_size))
+
+    def page(self, number: int, page_size: int):
+        """1부터 시작하는 number 번째 페이지의 결과 dict 목록."""
+        start = (number - 1) * page_size
+        return [
+            self._index._result(doc_id, self.matched[doc_id])
+            for doc_id in self.order[start:start + page_size]
+        ]
+
+    def all(self):
+        return self.page(1, self.total) if self.total else []
+
+
+# 5. 검색 결과 캐시
+def normalize_query(query: str) -> str:
+    """캐시/위젯 키용 정규화. 불리언 연산자는 대문자일 때만 연산자이므로 대소문자를 그대로 둔다."""
+    if is_boolean_query(query):
+        return " ".join(token if token in OPERATORS else normalize(token) for token in lex_query(query))
+    return " ".join(normalize(query).split())
+
+
+class SearchCache:
+    """프로세스 전체(모든 세션)가 공유하는 LRU 캐시.
+
+    키는 (정규화된 검색어, 옵션...) 이고, 카탈로그 버전이 바뀌면 통째로 비운다.
+    반환된 결과는 여러 세션이 함께 보므로 수정하지 말 것.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, version: str, key, compute):
+        with self._lock:
+            if version != self.version:
+                self._entries.clear()
+                self.version = version
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = compute()
+
+        with self._lock:
+            if version == self.version:
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return value
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "hit_rate": (self.hits / total) if total else 0.0
+            }
@@ -0,0 +1,75 @@
+import threading
+
+
+class SingleFlightTimeout(TimeoutError):
+    """기다리는 동안 leader 의 실행이 끝나지 않음."""
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "shared")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.shared = 0
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 호출은 하나만 실제로 실행하고, 나머지는 그 결과를 함께 받는다.
+    실행이 끝나면 키를 지우므로 결과를 오래 보관하는 캐시는 아니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, timeout: float = None):
+        """fn() 의 결과를 반환. 같은 key 로 이미 실행 중이면 끝날 때까지 (최대 timeout 초) 기다렸다가
+        그 결과(또는 예외)를 받는다."""
+        call, leader = self.join(key)
+        if not leader:
+            return self.wait(call, timeout)
+
+        try:
+            result = fn()
+        except BaseException as e:
+            # KeyboardInterrupt, 스크립트 중단/재실행 같은 예외에도 키를 지워야 이후 호출이 멈추지 않는다.
+            # 이런 예외는 이 호출자에게만 해당하므로 기다리던 쪽에는 일반 오류로 넘긴다.
+            error = e if isinstance(e, Exception) else RuntimeError("single-flight call was interrupted")
+            self.finish(key, call, error=error)
+            raise
+        self.finish(key, call, result)
+        return result
+
+    # do() 를 쓸 수 없는 경우 (결과를 제너레이터로 조금씩 내보내는 스트리밍 등) 를 위한 단계별 API.
+    # join 에서 leader 가 된 쪽은 반드시 finish 를 불러야 기다리는 쪽이 풀린다.
+    def join(self, key):
+        """(call, leader). leader 이면 직접 실행하고, 아니면 wait(call) 로 결과를 기다린다."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.shared += 1
+        return call, leader
+
+    def wait(self, call, timeout: float = None):
+        """leader 의 결과를 기다린다. timeout 초 안에 끝나지 않으면 SingleFlightTimeout."""
+        if not call.done.wait(timeout):
+            raise SingleFlightTimeout(f"single-flight call did not finish in {timeout:g}s")
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def finish(self, key, call, result=None, error=None):
+        """leader 의 결과(또는 예외)를 기다리던 쪽에 넘기고 키를 지운다."""
+        call.result = result
+        call.error = error
+        with self._lock:
+            del self._calls[key]
+        call.done.set()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
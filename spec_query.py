@@ -0,0 +1,101 @@
+import operator
+import re
+
+import numpy as np
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+# 스펙 조건 검색
+#  - "10GbE포트>=32 and 소모전력(W)<500 and 크기(U)<=4" 같은 식을 조건 목록으로 바꾸고,
+#    equipment_specs 의 숫자 컬럼에 대해 한 번에 평가한다.
+#  - 행 수가 많으면 컬럼별로 미리 정렬해 둔 값에 이진 탐색(searchsorted)을 쓴다.
+SORTED_INDEX_MIN_ROWS = 10000
+
+_OPERATORS = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    "==": operator.eq,
+    "=": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt
+}
+_CONDITION_RE = re.compile(r"^\s*(.+?)\s*(>=|<=|==|!=|=|>|<)\s*(-?\d+(?:\.\d+)?)\s*$")
+_JOIN_RE = re.compile(r"\s+(?:and|AND|그리고)\s+|\s*(?:,|&&|&)\s*")
+
+
+class SpecFilterError(ValueError):
+    pass
+
+
+def parse_spec_filter(expression: str, columns):
+    """조건식을 [(컬럼, 연산자, 값), ...] 으로. columns: 조건에 쓸 수 있는 숫자 컬럼 목록."""
+    conditions = []
+    for part in _JOIN_RE.split(expression.strip()):
+        if not part.strip():
+            continue
+        match = _CONDITION_RE.match(part)
+        if not match:
+            raise SpecFilterError(f"조건을 해석할 수 없습니다: '{part.strip()}' (예: 소모전력(W)<500)")
+        column, op, value = match.groups()
+        if column not in columns:
+            raise SpecFilterError(f"알 수 없는 컬럼입니다: '{column}' (사용 가능: {', '.join(columns)})")
+        conditions.append((column, op, float(value)))
+    if not conditions:
+        raise SpecFilterError("조건을 입력하세요. 예: 10GbE포트>=32 and 소모전력(W)<500")
+    return conditions
+
+
+class SpecIndex:
+    """equipment_specs 의 숫자 컬럼 조건 검색기. 카탈로그 버전마다 한 번 만든다."""
+
+    def __init__(self, specs, sorted_min_rows: int = SORTED_INDEX_MIN_ROWS):
+        self.specs = specs
+        self.columns = [
+            column for column in specs.columns
+            if is_numeric_dtype(specs[column]) and not is_bool_dtype(specs[column])
+        ]
+        self._values = {column: specs[column].to_numpy(dtype=float) for column in self.columns}
+
+        # 대용량 카탈로그용: 컬럼별 정렬 순서, 정렬된 값, NaN 이 아닌 값의 수 (argsort 는 NaN 을 맨 뒤로 보낸다)
+        self._sorted = {}
+        if len(specs) >= sorted_min_rows:
+            for column, values in self._values.items():
+                order = np.argsort(values, kind="stable")
+                self._sorted[column] = (order, values[order], int(np.count_nonzero(~np.isnan(values))))
+
+    def _condition_mask(self, column, op, value):
+        if column not in self._sorted:
+            return _OPERATORS[op](self._values[column], value)
+
+        # NaN 은 어떤 비교도 만족하지 않으므로 (!= 제외) NaN 이 아닌 앞부분에서만 찾는다
+        order, sorted_values, n_valid = self._sorted[column]
+        valid_values = sorted_values[:n_valid]
+        low = np.searchsorted(valid_values, value, side="left")
+        high = np.searchsorted(valid_values, value, side="right")
+        ranges = {
+            ">=": (low, n_valid),
+            ">": (high, n_valid),
+            "<=": (0, high),
+            "<": (0, low),
+            "==": (low, high),
+            "=": (low, high)
+        }
+        mask = np.zeros(len(sorted_values), dtype=bool)
+        if op == "!=":
+            mask[:] = True
+            mask[order[low:high]] = False
+        else:
+            start, end = ranges[op]
+            mask[order[start:end]] = True
+        return mask
+
+    def mask(self, conditions):
+        mask = np.ones(len(self.specs), dtype=bool)
+        for column, op, value in conditions:
+            mask &= self._condition_mask(column, op, value)
+        return mask
+
+    def query(self, expression: str):
+        """조건식을 만족하는 행들의 DataFrame. 잘못된 식이면 SpecFilterError."""
+        conditions = parse_spec_filter(expression, self.columns)
+        return self.specs[self.mask(conditions)]
@@ -0,0 +1,30 @@
+from tokenizer import tokenize_query
+
+# 동의어/약어 사전
+#  - 같은 묶음의 단어는 서로 같은 뜻으로 본다 (한↔영, 약어↔원어, 통칭↔모델 시리즈).
+#  - 색인 시점에 문서에 묶음 중 하나라도 있으면 나머지 단어들도 그 문서의 "별칭" 필드로
+#    색인하므로, 검색 시에는 추가 비용 없이 확장된다.
+SYNONYM_GROUPS = [
+    ["암호", "암호화", "encryption", "보안", "lea-256", "otnsec", "macsec", "pqc", "qkd"],
+    ["백본", "backbone", "기간망", "장거리망", "opn", "potn"],
+    ["이더넷", "ethernet", "gbe", "10gbe", "100gbe"],
+    ["양자", "quantum", "qkd", "pqc"],
+    ["전용회선", "전용선", "leased line"],
+    ["프리밴", "freeban"],
+    ["액세스", "access", "가입자망"],
+    ["파장", "wavelength", "dwdm", "cwdm"],
+    ["절체", "보호절체", "protection", "switchover"],
+    ["동기", "sync-e", "synchronization", "클럭"],
+    ["회선 에뮬레이션", "circuit emulation", "ces"],
+    ["품질", "qos", "quality of service"],
+    ["광전송", "optical", "otn"]
+]
+
+
+def compile_synonyms(groups=SYNONYM_GROUPS):
+    """[[단어별 필수 검색 토큰 목록, ...], ...] — 색인 시 문서 포함 여부 판정과 별칭 색인에 쓴다."""
+    compiled = []
+    for group in groups:
+        members = [tokenize_query(word)[0] for word in group]
+        compiled.append([terms for terms in members if terms])
+    return compiled
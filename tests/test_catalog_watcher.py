@@ -0,0 +1,59 @@
+import os
+import shutil
+
+import pytest
+
+from catalog import CATALOG_PATH, CatalogWatcher
+
+
+@pytest.fixture
+def watcher(tmp_path):
+    path = tmp_path / "catalog.json"
+    shutil.copy(CATALOG_PATH, path)
+    # 자동 확인은 끄고 (긴 간격) check() 를 직접 부른다
+    watcher = CatalogWatcher(path=str(path), interval=3600)
+    yield watcher, path
+    watcher.stop()
+
+
+def _write(path, data: bytes, bump: int):
+    path.write_bytes(data)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump))
+
+
+def test_reverted_write_clears_error(watcher):
+    watcher, path = watcher
+    original = path.read_bytes()
+    version = watcher.version
+
+    _write(path, original[:len(original) // 2], 1_000_000_000)
+    assert watcher.check() is False
+    assert watcher.last_error is not None
+
+    _write(path, original, 2_000_000_000)
+    assert watcher.check() is False
+    assert watcher.last_error is None
+    assert watcher.version == version
+
+
+def test_build_error_keeps_previous_bundle(tmp_path):
+    path = tmp_path / "catalog.json"
+    shutil.copy(CATALOG_PATH, path)
+    builds = []
+
+    def build(catalog):
+        builds.append(catalog.version)
+        if len(builds) > 1:
+            raise TypeError("bad entry")
+        return catalog
+
+    watcher = CatalogWatcher(build=build, path=str(path), interval=3600)
+    try:
+        bundle = watcher.current()
+        _write(path, path.read_bytes().replace(b'"glossary": {', b'"glossary": {"X": {}, ', 1), 1_000_000_000)
+        assert watcher.check() is False
+        assert isinstance(watcher.last_error, TypeError)
+        assert watcher.current() is bundle
+    finally:
+        watcher.stop()
@@ -0,0 +1,70 @@
+import pytest
+
+from catalog import load_catalog
+from query_parser import is_boolean_query, parse_query, positive_terms
+from search_engine import SearchIndex
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("PTN AND CES", ("and", [("word", "PTN"), ("word", "CES")])),
+    ("PTN CES", ("and", [("word", "PTN"), ("word", "CES")])),
+    ("PTN OR CES", ("or", [("word", "PTN"), ("word", "CES")])),
+    ("PTN NOT CES", ("and", [("word", "PTN"), ("not", ("word", "CES"))])),
+    ('"50ms 절체"', ("phrase", "50ms 절체")),
+    ("(OTN OR DWDM) 백본", ("and", [("or", [("word", "OTN"), ("word", "DWDM")]), ("word", "백본")])),
+])
+def test_parse_query(query, expected):
+    assert parse_query(query) == expected
+
+
+# 입력 중에 흔히 나오는 미완성 검색어: 예외 없이 해석 가능한 부분만 남긴다
+@pytest.mark.parametrize("query, expected", [
+    ("PTN NOT", ("word", "PTN")),
+    ("NOT", None),
+    ("AND NOT", None),
+    ("NOT NOT", None),
+    ("PTN AND", ("word", "PTN")),
+    ("OR PTN", ("word", "PTN")),
+    ("PTN NOT OR CES", ("or", [("word", "PTN"), ("word", "CES")])),
+    ("PTN NOT AND CES", ("and", [("word", "PTN"), ("word", "CES")])),
+    ('""', None),
+    ('"', None),
+    ('PTN "', ("word", "PTN")),
+    ('"50ms 절체', ("phrase", "50ms 절체")),
+    ("(", None),
+    (")", None),
+    ("( )", None),
+    ("NOT (", None),
+    ("((PTN", ("word", "PTN")),
+    ("PTN)", ("word", "PTN")),
+    ("(PTN NOT)", ("word", "PTN")),
+    ("PTN) CES", ("and", [("word", "PTN"), ("word", "CES")])),
+])
+def test_parse_incomplete_query(query, expected):
+    assert parse_query(query) == expected
+
+
+def test_positive_terms_skip_not():
+    assert positive_terms(parse_query('PTN NOT CES "50ms 절체"')) == ["PTN", "50ms 절체"]
+
+
+def test_is_boolean_query():
+    assert is_boolean_query("PTN NOT")
+    assert is_boolean_query('"절체')
+    assert not is_boolean_query("ptn not ces")
+
+
+@pytest.fixture(scope="module")
+def index():
+    catalog = load_catalog()
+    return SearchIndex.build(catalog.detailed_equipment, catalog.glossary, catalog.equipment_comparison)
+
+
+@pytest.mark.parametrize("query", ["PTN NOT", "NOT", "AND NOT", "(PTN NOT)", '""', "(", ")"])
+def test_search_incomplete_query(index, query):
+    # 예외 없이 검색되어야 한다 (통합 검색/용어 사전 필터가 입력 중에 같은 경로를 탄다)
+    assert isinstance(index.search(query, rank=True), list)
+
+
+def test_search_dangling_not_keeps_operand(index):
+    assert [r["제목"] for r in index.search("PTN NOT")] == [r["제목"] for r in index.search("PTN")]
@@ -0,0 +1,29 @@
+import pytest
+
+from catalog import load_catalog
+from search_engine import SearchIndex
+
+
+@pytest.fixture(scope="module")
+def index():
+    catalog = load_catalog()
+    specs = catalog.equipment_specs
+    return SearchIndex.build(
+        catalog.detailed_equipment, catalog.glossary, catalog.equipment_comparison,
+        dict(zip(specs["모델명"], specs["분류"]))
+    )
+
+
+@pytest.mark.parametrize("query", ["PTN", "암호화 장비", "ㅈㅇㅎㅅ", "PTN NOT CES", "(OTN OR DWDM) 백본", '"전용 회선"'])
+def test_ranked_hits_follow_score(index, query):
+    hits = index.hits(query, rank=True)
+    scores = index.score(query)
+    assert set(hits.order) == set(index.match(query))
+    assert list(hits.order) == sorted(hits.order, key=lambda doc_id: (-scores.get(doc_id, 0.0), doc_id))
+
+
+
+def test_equipment_class_facet_only_on_equipment(index):
+    assert set(index.facet_bits["분류"]) == {"POTN", "PTN"}
+    refined = index.hits("PTN").refine({"분류": ["PTN"]}).all()
+    assert refined and all(result["유형"] == "장비" for result in refined)
@@ -0,0 +1,54 @@
+import threading
+
+import pytest
+
+from singleflight import SingleFlight, SingleFlightTimeout
+
+
+def test_do_shares_result_with_waiting_callers():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return "result"
+
+    leader = threading.Thread(target=lambda: flight.do("k", slow))
+    leader.start()
+    started.wait()
+    results = []
+    followers = [threading.Thread(target=lambda: results.append(flight.do("k", slow))) for _ in range(3)]
+    for follower in followers:
+        follower.start()
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+    assert calls == [1]
+    assert results == ["result"] * 3
+    assert flight.in_flight() == 0
+
+
+def test_do_clears_key_on_base_exception():
+    flight = SingleFlight()
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        flight.do("k", interrupted)
+    assert flight.in_flight() == 0
+    assert flight.do("k", lambda: 1) == 1
+
+
+def test_wait_timeout():
+    flight = SingleFlight()
+    call, leader = flight.join("k")
+    assert leader
+    with pytest.raises(SingleFlightTimeout):
+        flight.do("k", lambda: 1, timeout=0.01)
+    flight.finish("k", call, "done")
+    assert flight.wait(call) == "done"
+    assert flight.in_flight() == 0
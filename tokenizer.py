@@ -0,0 +1,174 @@
+import re
+import unicodedata
+from typing import NamedTuple
+
+# 1. 토큰 정의
+#    - term: 색인어 (소문자), start/end: 원문 내 문자 위치
+class Token(NamedTuple):
+    term: str
+    start: int
+    end: int
+
+
+# 2. 문자 구간 분리
+#    - 영문/숫자: "APN-200A", "MPLS-TP" 처럼 하이픈/슬래시/점으로 이어진 모델명을 한 토큰으로
+#    - 한글: 공백으로만 떨어진 어절들은 하나의 구간으로 묶어 n-gram 을 만든다
+_ALNUM_RE = re.compile(r"[0-9a-z]+(?:[-/.][0-9a-z]+)*")
+_ALNUM_SPLIT_RE = re.compile(r"[-/.]")
+_SLASH_SPLIT_RE = re.compile(r"/")
+_HANGUL_WORD_RE = re.compile(r"[가-힣]+")
+_HANGUL_RUN_RE = re.compile(r"[가-힣]+(?:\s+[가-힣]+)*")
+
+# 3. 조사 제거
+#    - "암호화를/암호화는" → "암호화". 짧은 단어는 어간이 잘리지 않도록 건드리지 않는다.
+PARTICLES = (
+    "에서", "에게", "까지", "부터", "보다", "처럼", "으로",
+    "은", "는", "이", "가", "을", "를", "의", "에", "와", "과", "도", "로", "만"
+)
+NGRAM_SIZES = (2, 3)
+
+
+def normalize(text: str) -> str:
+    return unicodedata.normalize("NFC", text).lower()
+
+
+def is_hangul(term: str) -> bool:
+    return bool(term) and "가" <= term[0] <= "힣"
+
+
+def strip_particle(word: str) -> str:
+    for particle in PARTICLES:
+        if word.endswith(particle) and len(word) - len(particle) >= 2:
+            return word[:-len(particle)]
+    return word
+
+
+def _split_token(token: Token, pattern):
+    parts = []
+    offset = 0
+    for part in pattern.split(token.term):
+        if part:
+            start = token.term.index(part, offset)
+            parts.append(Token(part, token.start + start, token.start + start + len(part)))
+            offset = start + len(part)
+    return parts if len(parts) > 1 else []
+
+
+def _alnum_tokens(text: str, parts: bool = True):
+    """영숫자 토큰. parts=True 이면 "DS1E/STM-1" → "ds1e", "stm-1", "stm", "1" 처럼
+    슬래시로 나뉜 조각과 하이픈으로 나뉜 부분도 함께 낸다."""
+    tokens = []
+    for match in _ALNUM_RE.finditer(text):
+        token = Token(match.group(), match.start(), match.end())
+        tokens.append(token)
+        if parts:
+            tokens.extend(_split_token(token, _SLASH_SPLIT_RE))
+            tokens.extend(_split_token(token, _ALNUM_SPLIT_RE))
+    return list(dict.fromkeys(tokens))
+
+
+def _ngrams(chars, sizes):
+    """chars: [(글자, 원문 위치), ...] 에서 n-gram 토큰을 만든다."""
+    tokens = []
+    for n in sizes:
+        for i in range(len(chars) - n + 1):
+            window = chars[i:i + n]
+            tokens.append(Token("".join(c for c, _ in window), window[0][1], window[-1][1] + 1))
+    return tokens
+
+
+def _hangul_tokens(text: str):
+    tokens = []
+    for run in _HANGUL_RUN_RE.finditer(text):
+        joined = []
+        for word in _HANGUL_WORD_RE.finditer(run.group()):
+            start = run.start() + word.start()
+            chars = [(c, start + i) for i, c in enumerate(word.group())]
+            stem = chars[:len(strip_particle(word.group()))]
+
+            # 어절 원형의 1/2/3-gram (조사 뗀 어간의 n-gram 도 여기에 포함된다)
+            tokens.extend(_ngrams(chars, (1,) + NGRAM_SIZES))
+            joined.extend(stem)
+
+        # 띄어쓰기 무시: "전용 회선" 도 "전용회선" 의 n-gram 을 갖도록 어간을 이어 붙인다
+        tokens.extend(_ngrams(joined, NGRAM_SIZES))
+    return list(dict.fromkeys(tokens))
+
+
+def tokenize(text: str):
+    """색인용 토큰 목록 (영숫자 토큰 + 한글 1/2/3-gram)."""
+    text = normalize(text)
+    return _alnum_tokens(text) + _hangul_tokens(text)
+
+
+def tokenize_query(text: str):
+    """검색어 토큰. 반환: (필수 토큰, 가산점용 토큰)
+
+    - 영숫자: 나누지 않은 토큰 그대로 (색인에서는 접두사로 조회)
+    - 한글: 조사를 뗀 어절의 bigram 이 필수, trigram 은 점수에만 반영
+    """
+    text = normalize(text)
+    required = [token.term for token in _alnum_tokens(text, parts=False)]
+    boost = []
+    for word in _HANGUL_WORD_RE.finditer(text):
+        stem = strip_particle(word.group())
+        if len(stem) == 1:
+            required.append(stem)
+            continue
+        required.extend(stem[i:i + 2] for i in range(len(stem) - 1))
+        boost.extend(stem[i:i + 3] for i in range(len(stem) - 2))
+    return list(dict.fromkeys(required)), list(dict.fromkeys(boost))
+
+
+# 4. 초성 (ㅈㅇㅎㅅ → 전용회선)
+#    - 한글 음절을 초성으로 바꾼 문자열을 색인 시점에 한 번만 만든다.
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSUNG_QUERY_RE = re.compile(r"[ㄱ-ㅎ\s]+")
+
+
+def is_chosung_query(text: str) -> bool:
+    text = text.strip()
+    return bool(text) and bool(_CHOSUNG_QUERY_RE.fullmatch(text))
+
+
+def chosung_runs(text: str):
+    """한글 구간별 초성 문자열과 각 초성의 원문 위치. 반환: [(초성 문자열, [위치, ...]), ...]
+
+    공백으로만 떨어진 어절은 한 구간으로 이어 "전용 회선" 도 "ㅈㅇㅎㅅ" 이 된다.
+    """
+    runs = []
+    for run in _HANGUL_RUN_RE.finditer(normalize(text)):
+        consonants = []
+        positions = []
+        for i, char in enumerate(run.group()):
+            if "가" <= char <= "힣":
+                consonants.append(CHOSUNG[(ord(char) - ord("가")) // 588])
+                positions.append(run.start() + i)
+        runs.append(("".join(consonants), positions))
+    return runs
+
+
+def chosung_tokens(runs):
+    """초성 구간에서 1/2-gram 토큰을 만든다."""
+    tokens = []
+    for consonants, positions in runs:
+        chars = list(zip(consonants, positions))
+        tokens.extend(_ngrams(chars, (1, 2)))
+    return tokens
+
+
+def tokenize_chosung_query(text: str):
+    """초성 검색어의 필수 토큰 (공백 무시, bigram. 한 글자면 그대로)."""
+    consonants = "".join(text.split())
+    if len(consonants) == 1:
+        return [consonants]
+    return list(dict.fromkeys(consonants[i:i + 2] for i in range(len(consonants) - 1)))
+
+
+# 5. 구문 검색
+_PHRASE_WORD_RE = re.compile(_ALNUM_RE.pattern + r"|[가-힣]+")
+
+
+def phrase_words(text: str):
+    """구문을 순서대로 영숫자 토큰 / 한글 어절로 나눈다 ("10GbE포트" → ["10gbe", "포트"])."""
+    return [match.group() for match in _PHRASE_WORD_RE.finditer(normalize(text))]
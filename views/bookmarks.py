@@ -0,0 +1,32 @@
+import streamlit as st
+
+import database as db
+
+
+def show_bookmarks(bundle):
+    st.markdown('<p class="main-header">⭐ 즐겨찾기</p>', unsafe_allow_html=True)
+    
+    bookmarks = db.get_bookmarks()
+    
+    if bookmarks:
+        st.success(f"**{len(bookmarks)}개의 즐겨찾기가 있습니다.**")
+        
+        for bookmark in bookmarks:
+            col1, col2 = st.columns([4, 1])
+            
+            with col1:
+                st.markdown(f"### [{bookmark.item_type}] {bookmark.title}")
+                st.markdown(f"**카테고리:** {bookmark.category}")
+                st.markdown(f"**추가일:** {bookmark.created_at.strftime('%Y-%m-%d %H:%M')}")
+            
+            with col2:
+                if st.button("삭제", key=f"del_bm_{bookmark.id}"):
+                    if db.remove_bookmark(bookmark.item_id):
+                        st.success("삭제되었습니다!")
+                        st.rerun()
+            
+            st.markdown("---")
+    else:
+        st.info("저장된 즐겨찾기가 없습니다.")
+        st.markdown("### 💡 사용 방법")
+        st.markdown("- 장비 상세 정보, 용어 사전 등에서 ⭐ 버튼을 클릭하여 즐겨찾기에 추가할 수 있습니다.")
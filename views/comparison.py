@@ -0,0 +1,201 @@
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+
+@st.cache_resource
+def get_radar_chart():
+    """기술 비교 레이더 차트. 입력이 고정값이라 프로세스당 한 번만 만든다 (수정 금지)."""
+    categories = ['용량', '유연성', '효율성', '안정성', '확장성']
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatterpolar(
+        r=[3, 2, 3, 5, 2],
+        theta=categories,
+        fill='toself',
+        name='MSPP',
+        line=dict(color='#cc6600')
+    ))
+    
+    fig.add_trace(go.Scatterpolar(
+        r=[4, 5, 4, 4, 4],
+        theta=categories,
+        fill='toself',
+        name='PTN',
+        line=dict(color='#00cc66')
+    ))
+    
+    fig.add_trace(go.Scatterpolar(
+        r=[5, 5, 5, 5, 5],
+        theta=categories,
+        fill='toself',
+        name='POTN',
+        line=dict(color='#0066cc')
+    ))
+    
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 5])),
+        showlegend=True,
+        height=500
+    )
+    
+    return fig
+
+
+def show_comparison(bundle):
+    st.markdown('<p class="main-header">⚖️ 기술 비교</p>', unsafe_allow_html=True)
+    
+    tab1, tab2 = st.tabs(["📊 MSPP/PTN/POTN 비교", "🔒 암호화 기술 비교"])
+    
+    with tab1:
+        st.markdown("### MSPP vs PTN vs POTN 상세 비교")
+        
+        comparison_df = pd.DataFrame({
+            "비교항목": ["스위칭용량", "전달기술", "토폴로지", "회선보호", "대역효율", "주요용도"],
+            "MSPP": [
+                "320G 이하",
+                "SDH",
+                "Linear, Ring",
+                "50ms 절체 (H/W)",
+                "대역 전용",
+                "TDM신호 전송"
+            ],
+            "PTN": [
+                "400G 이하",
+                "MPLS-TP",
+                "Linear, Ring, Mesh",
+                "50ms 절체 (S/W)",
+                "대역 공유 (CIR, PIR)",
+                "Ethernet 전송"
+            ],
+            "POTN": [
+                "2.4Tbps 이하",
+                "MPLS-TP, OTN, DWDM",
+                "Linear, Ring, Mesh",
+                "50ms 절체 (H/W+S/W)",
+                "대역전용+공유 혼용",
+                "대용량 Ethernet"
+            ]
+        })
+        
+        st.dataframe(comparison_df, use_container_width=True, hide_index=True)
+        
+        st.markdown("---")
+        st.markdown("### 📈 기술별 특성 레이더 차트")
+        
+        fig = get_radar_chart()
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        st.markdown("---")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.markdown('<div class="info-box">', unsafe_allow_html=True)
+            st.markdown("#### MSPP 장점")
+            st.markdown("✅ 안정적인 TDM 전송")
+            st.markdown("✅ H/W 기반 빠른 절체")
+            st.markdown("✅ 검증된 기술")
+            st.markdown("</div>", unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown('<div class="success-box">', unsafe_allow_html=True)
+            st.markdown("#### PTN 장점")
+            st.markdown("✅ 유연한 대역 공유")
+            st.markdown("✅ 다양한 서비스 제공")
+            st.markdown("✅ Mesh 구성 가능")
+            st.markdown("</div>", unsafe_allow_html=True)
+        
+        with col3:
+            st.markdown('<div class="info-box">', unsafe_allow_html=True)
+            st.markdown("#### POTN 장점")
+            st.markdown("✅ 초대용량 (2.4Tbps)")
+            st.markdown("✅ OTN+MPLS-TP 통합")
+            st.markdown("✅ DWDM 지원")
+            st.markdown("</div>", unsafe_allow_html=True)
+    
+    with tab2:
+        st.markdown("### 🔐 암호화 기술 상세 비교")
+        
+        enc_comparison = pd.DataFrame({
+            "항목": ["암호화 계위", "암호화 단위", "전송 효율", "암호화 알고리즘", "투자비", "암호 등급"],
+            "OTNsec": [
+                "Layer 1",
+                "ODU 단위",
+                "100% (손실 없음)",
+                "AES-256, LEA-256",
+                "높음",
+                "높음 (양자키)"
+            ],
+            "MACsec": [
+                "Layer 2",
+                "패킷 단위",
+                "3~40% 손실",
+                "AES-128/256",
+                "낮음",
+                "낮음 (공용키)"
+            ],
+            "APN-S40 (PQC)": [
+                "Layer 2",
+                "패킷/VLAN 단위",
+                "3~40% 손실",
+                "LEA-256",
+                "낮음",
+                "높음 (PQC/QKD)"
+            ]
+        })
+        
+        st.dataframe(enc_comparison, use_container_width=True, hide_index=True)
+        
+        st.markdown("---")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.markdown('<div class="info-box">', unsafe_allow_html=True)
+            st.markdown("#### OTNsec")
+            st.markdown("**최고 보안 + 성능**")
+            st.markdown("- ✅ 대역폭 손실 없음")
+            st.markdown("- ✅ 양자키 지원")
+            st.markdown("- ❌ 투자비 높음")
+            st.markdown("- 적용: OPN 시리즈")
+            st.markdown("</div>", unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown('<div class="warning-box">', unsafe_allow_html=True)
+            st.markdown("#### MACsec")
+            st.markdown("**표준 보안**")
+            st.markdown("- ✅ 투자비 낮음")
+            st.markdown("- ✅ 표준 프로토콜")
+            st.markdown("- ❌ 대역폭 손실")
+            st.markdown("- 적용: 일반 장비")
+            st.markdown("</div>", unsafe_allow_html=True)
+        
+        with col3:
+            st.markdown('<div class="success-box">', unsafe_allow_html=True)
+            st.markdown("#### APN-S40 (PQC)")
+            st.markdown("**차세대 보안**")
+            st.markdown("- ✅ 양자내성암호")
+            st.markdown("- ✅ 양자키 연동")
+            st.markdown("- ✅ 국내표준(LEA)")
+            st.markdown("- 적용: APN-S40")
+            st.markdown("</div>", unsafe_allow_html=True)
+        
+        st.markdown("---")
+        st.markdown("### 🔑 KEY 생성 방식")
+        
+        key_info = pd.DataFrame({
+            "KEY 방식": ["공용키 (Public Key)", "양자내성키 (PQC)", "양자키 (QKD)", "Hybrid Key"],
+            "설명": [
+                "일반적인 암호키 생성 방식",
+                "양자컴퓨터 공격에 안전한 키",
+                "양자역학 기반 절대 안전 키",
+                "공용키 + PQC 또는 QKD 조합"
+            ],
+            "보안수준": ["보통", "높음", "매우높음", "매우높음"],
+            "적용기술": ["MACsec", "APN-S40", "OTNsec, APN-S40", "OTNsec, APN-S40"]
+        })
+        
+        st.dataframe(key_info, use_container_width=True, hide_index=True)
@@ -0,0 +1,72 @@
+import streamlit as st
+
+
+@st.fragment
+def show_equipment_detail_panel(catalog):
+    """분류/모델 선택을 바꾸면 페이지 전체가 아니라 이 영역만 다시 실행된다."""
+    detailed_equipment = catalog.detailed_equipment
+    equipment_specs = catalog.equipment_specs
+    
+    category = st.selectbox(
+        "장비 분류 선택",
+        ["POTN", "PTN", "PTN 특수장비"]
+    )
+    
+    if category == "POTN":
+        models = ["OPN-3100", "OPN-3000", "OPN-1000"]
+    elif category == "PTN":
+        models = ["APN-400A", "APN-200A", "APN-100A", "APN-60A", "APN-50A"]
+    else:
+        models = ["APN-20D", "APN-S40"]
+    
+    selected_model = st.selectbox("모델 선택", models)
+    
+    if selected_model in detailed_equipment:
+        equipment = detailed_equipment[selected_model]
+        
+        col1, col2 = st.columns([1, 2])
+        
+        with col1:
+            st.markdown('<div class="info-box">', unsafe_allow_html=True)
+            st.markdown(f"### {selected_model}")
+            st.markdown(f"**스위칭 용량:** {equipment['용량']}")
+            st.markdown(f"**크기:** {equipment['크기']}")
+            st.markdown(f"**적용 분야:**")
+            st.markdown(f"{equipment['적용분야']}")
+            st.markdown("</div>", unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown("#### 주요 인터페이스")
+            for interface in equipment["주요인터페이스"]:
+                st.markdown(f"- {interface}")
+        
+        st.markdown("---")
+        st.markdown("#### 주요 특징")
+        
+        cols = st.columns(2)
+        for idx, feature in enumerate(equipment["특징"]):
+            with cols[idx % 2]:
+                st.markdown(f"✅ {feature}")
+        
+        st.markdown("---")
+        
+        spec_row = equipment_specs[equipment_specs["모델명"] == selected_model]
+        if not spec_row.empty:
+            st.markdown("#### 상세 스펙")
+            
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                st.metric("10GbE 포트", f"{spec_row.iloc[0]['10GbE포트']} Port")
+            with col2:
+                st.metric("1GbE 포트", f"{spec_row.iloc[0]['1GbE포트']} Port")
+            with col3:
+                st.metric("크기", f"{spec_row.iloc[0]['크기(U)']} U")
+            with col4:
+                st.metric("소모전력", f"{spec_row.iloc[0]['소모전력(W)']} W")
+
+
+def show_equipment_details(bundle):
+    st.markdown('<p class="main-header">🔍 장비 상세 정보</p>', unsafe_allow_html=True)
+    
+    show_equipment_detail_panel(bundle.catalog)
@@ -0,0 +1,42 @@
+import streamlit as st
+
+
+def show_glossary(bundle):
+    glossary = bundle.catalog.glossary
+    
+    st.markdown('<p class="main-header">📚 전문 용어 사전</p>', unsafe_allow_html=True)
+    st.markdown("**전송장비 관련 주요 용어를 쉽게 이해하세요**")
+    
+    st.markdown("---")
+    
+    category_filter = st.selectbox(
+        "카테고리 선택",
+        ["전체", "장비 유형", "전송 기술", "프로토콜", "보안/암호화", "기타"]
+    )
+    
+    category_mapping = {
+        "장비 유형": ["MSPP", "PTN", "POTN"],
+        "전송 기술": ["SDH", "OTN", "DWDM", "CES"],
+        "프로토콜": ["MPLS-TP", "Sync-E", "OAM"],
+        "보안/암호화": ["LEA-256", "QKD", "PQC"],
+        "기타": ["E1", "STM-1", "QoS"]
+    }
+    
+    if category_filter == "전체":
+        filtered_terms = list(glossary.keys())
+    else:
+        filtered_terms = category_mapping.get(category_filter, [])
+    
+    search_term = st.text_input("🔍 용어 검색", placeholder="예: MPLS, OTN, 암호화...")
+    
+    if search_term:
+        filtered_terms = [result["제목"] for result in bundle.search_index.search(search_term, kinds=("용어",))]
+    
+    for term in filtered_terms:
+        if term in glossary:
+            with st.expander(f"**{term}** - {glossary[term]['정의']}", expanded=False):
+                st.markdown(f"**기술적 설명:**")
+                st.markdown(glossary[term]['설명'])
+                
+                st.markdown(f"**쉬운 설명:**")
+                st.markdown(f"💡 {glossary[term]['쉬운설명']}")
@@ -0,0 +1,86 @@
+import plotly.graph_objects as go
+import streamlit as st
+
+from catalog import MAX_CAPACITY_COLUMN
+
+
+@st.cache_resource(max_entries=1)
+def get_capacity_chart(version, _bundle):
+    """홈 화면 용량 막대 차트. 카탈로그 버전마다 한 번 만들어 모든 세션이 공유한다 (수정 금지)."""
+    fig = go.Figure()
+    
+    df_chart = _bundle.specs_by_capacity
+    
+    colors = {"POTN": "#0066cc", "PTN": "#00cc66", "MSPP": "#cc6600"}
+    
+    fig.add_trace(go.Bar(
+        y=df_chart["모델명"],
+        x=df_chart[MAX_CAPACITY_COLUMN],
+        orientation='h',
+        marker=dict(
+            color=[colors[cat] for cat in df_chart["분류"]],
+        ),
+        text=df_chart["스위칭용량"],
+        textposition='auto',
+    ))
+    
+    fig.update_layout(
+        title="장비별 스위칭 용량 비교",
+        xaxis_title="스위칭 용량 (Gbps)",
+        yaxis_title="모델명",
+        height=500,
+        showlegend=False
+    )
+    
+    return fig
+
+
+def show_home(bundle):
+    st.markdown('<p class="main-header">📡 전송장비 학습 대시보드</p>', unsafe_allow_html=True)
+    st.markdown("**SK브로드밴드 B2B 영업 담당자를 위한 전송장비 기술 가이드**")
+    
+    st.markdown("---")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown('<div class="info-box">', unsafe_allow_html=True)
+        st.markdown("### 🎯 MSPP")
+        st.markdown("**전통적 TDM 전송장비**")
+        st.markdown("- 스위칭: ~320G")
+        st.markdown("- 기술: SDH")
+        st.markdown("- 용도: TDM 신호")
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown('<div class="info-box">', unsafe_allow_html=True)
+        st.markdown("### 🚀 PTN")
+        st.markdown("**패킷 전송 네트워크**")
+        st.markdown("- 스위칭: ~400G")
+        st.markdown("- 기술: MPLS-TP")
+        st.markdown("- 용도: Ethernet")
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown('<div class="info-box">', unsafe_allow_html=True)
+        st.markdown("### ⚡ POTN")
+        st.markdown("**차세대 광전송 네트워크**")
+        st.markdown("- 스위칭: ~2.4Tbps")
+        st.markdown("- 기술: OTN+MPLS-TP+DWDM")
+        st.markdown("- 용도: 대용량 백본")
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+    st.markdown("---")
+    st.markdown("### 📊 주요 장비 성능 비교")
+    
+    fig = get_capacity_chart(bundle.catalog.version, bundle)
+    
+    st.plotly_chart(fig, use_container_width=True)
+    
+    st.markdown("---")
+    st.markdown("### 📋 전체 장비 스펙 요약")
+    st.dataframe(
+        bundle.specs_summary,
+        use_container_width=True,
+        hide_index=True
+    )
@@ -0,0 +1,116 @@
+import streamlit as st
+
+
+def show_network_config(bundle):
+    network_configs = bundle.catalog.network_configs
+    
+    st.markdown('<p class="main-header">🌐 망 구성도 가이드</p>', unsafe_allow_html=True)
+    
+    config_type = st.selectbox(
+        "망 구성 유형 선택",
+        list(network_configs),
+        key="network_config_type"
+    )
+    
+    config = network_configs[config_type]
+    
+    st.markdown(f"### {config_type} 서비스")
+    
+    st.markdown('<div class="info-box">', unsafe_allow_html=True)
+    st.markdown(f"**서비스 설명:** {config['설명']}")
+    st.markdown("</div>", unsafe_allow_html=True)
+    
+    st.markdown("---")
+    st.markdown("#### 망 구성")
+    
+    for item in config["구성"]:
+        st.markdown(f"- {item}")
+    
+    st.markdown("---")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown('<div class="success-box">', unsafe_allow_html=True)
+        st.markdown("#### 적용 장비")
+        st.markdown(config["적용장비"])
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown('<div class="info-box">', unsafe_allow_html=True)
+        st.markdown("#### 주요 특징")
+        for feature in config["특징"]:
+            st.markdown(f"✅ {feature}")
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    if config_type == "전용회선":
+        st.markdown("#### 전용회선 망 구성 플로우")
+        st.markdown("""
+        ```
+        고객사 A
+            ↓ (선로)
+        수용국사 (COT)
+            ↓ (1G/10G Ring - PTN/MSPP)
+        백본국사 
+            ↓ (RoADM/OTN - 장거리망)
+        백본국사
+            ↓ (1G/10G Ring - PTN/MSPP)
+        수용국사 (COT)
+            ↓ (선로)
+        고객사 B
+        ```
+        """)
+        
+        st.markdown('<div class="warning-box">', unsafe_allow_html=True)
+        st.markdown("**💡 영업 포인트:**")
+        st.markdown("- 고객 전용 대역으로 안정적인 품질 보장")
+        st.markdown("- SLA 제공으로 비즈니스 연속성 확보")
+        st.markdown("- 보안이 중요한 금융/공공기관에 최적")
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+    elif config_type == "인터넷(프리밴)":
+        st.markdown("#### 프리밴 서비스 구성")
+        st.markdown("""
+        ```
+        고객사
+            ↓
+        1G/10G Ring (PTN)
+            ↓
+        백본국사 (FBS)
+            ├─→ PTN 기간망 (업무용 전용회선)
+            └─→ IP망 Core (인터넷)
+        ```
+        """)
+        
+        st.markdown('<div class="warning-box">', unsafe_allow_html=True)
+        st.markdown("**💡 영업 포인트:**")
+        st.markdown("- 전용회선 + 인터넷을 하나의 회선으로 통합")
+        st.markdown("- 투자비 절감 (회선 통합)")
+        st.markdown("- 유연한 대역 조절 가능")
+        st.markdown("- 중소기업에 경제적인 솔루션")
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+    else:
+        st.markdown("#### 저속급 서비스 구성 (채널MUX 일체형)")
+        st.markdown("""
+        ```
+        고객사
+            ↓ (E1 또는 DSO)
+        APN-20D (채널MUX 일체형)
+            ↓ (1G Ring)
+        상위 PTN 장비
+            ↓ (10G Ring)
+        백본망
+        ```
+        """)
+        
+        st.markdown('<div class="success-box">', unsafe_allow_html=True)
+        st.markdown("**💡 우리넷 차별점:**")
+        st.markdown("- **기존 방식:** PTN + 별도 채널MUX + FADP + 정류기 + 배터리 필요")
+        st.markdown("- **APN-20D:** 단일 장비로 모든 기능 통합")
+        st.markdown("- **비용 절감:** 부대설비 투자비 대폭 절감")
+        st.markdown("- **상면 절감:** 랙 공간 효율 향상")
+        st.markdown("- **관리 편의:** 단일 EMS로 통합 관리")
+        st.markdown("</div>", unsafe_allow_html=True)
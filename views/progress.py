@@ -0,0 +1,45 @@
+import streamlit as st
+
+import database as db
+
+
+def show_learning_progress(bundle):
+    st.markdown('<p class="main-header">📈 학습 진도</p>', unsafe_allow_html=True)
+    
+    pages = ["홈 (대시보드)", "기술 비교", "장비 상세 정보", "용어 사전", "망 구성도", "장비 추천", "퀴즈"]
+    
+    progress_data = db.get_learning_progress()
+    completed_pages = {p.page_name for p in progress_data if p.completed}
+    
+    total_pages = len(pages)
+    completed_count = len(completed_pages)
+    progress_percent = (completed_count / total_pages) * 100
+    
+    st.markdown("### 📊 전체 진행률")
+    st.progress(progress_percent / 100)
+    st.markdown(f"**{completed_count}/{total_pages}** 페이지 완료 ({progress_percent:.1f}%)")
+    
+    st.markdown("---")
+    st.markdown("### 📋 페이지별 진도")
+    
+    for page in pages:
+        col1, col2 = st.columns([3, 1])
+        
+        with col1:
+            completed = page in completed_pages
+            status = "✅" if completed else "⬜"
+            st.markdown(f"{status} **{page}**")
+        
+        with col2:
+            if completed:
+                if st.button("미완료", key=f"undo_{page}"):
+                    db.update_learning_progress(page, False)
+                    st.rerun()
+            else:
+                if st.button("완료", key=f"complete_{page}"):
+                    db.update_learning_progress(page, True)
+                    st.rerun()
+    
+    if completed_count == total_pages:
+        st.balloons()
+        st.success("🎉 축하합니다! 모든 학습을 완료하셨습니다!")
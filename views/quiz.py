@@ -0,0 +1,154 @@
+import streamlit as st
+
+import database as db
+
+
+@st.fragment
+def show_quiz_form(quizzes):
+    """문제 풀이 영역. 보기를 고를 때마다 이 영역만 다시 실행되고, 제출하면 결과 탭 갱신을 위해 전체를 다시 실행한다."""
+    quiz_level = st.selectbox("난이도 선택", ["기본", "중급"])
+    selected_quiz = quizzes[quiz_level]
+    
+    st.markdown(f"### {quiz_level} 퀴즈 ({len(selected_quiz)}문제)")
+    
+    if 'quiz_answers' not in st.session_state:
+        st.session_state.quiz_answers = {}
+    
+    for idx, q in enumerate(selected_quiz):
+        st.markdown(f"**Q{idx+1}. {q['question']}**")
+        answer = st.radio(
+            "답을 선택하세요:",
+            q['options'],
+            key=f"q_{quiz_level}_{idx}"
+        )
+        st.session_state.quiz_answers[f"{quiz_level}_{idx}"] = answer
+        st.markdown("---")
+    
+    if st.button("제출하기", type="primary"):
+        score = 0
+        results = []
+        
+        for idx, q in enumerate(selected_quiz):
+            user_answer = st.session_state.quiz_answers.get(f"{quiz_level}_{idx}")
+            correct = user_answer == q['answer']
+            if correct:
+                score += 1
+            
+            results.append({
+                "question": q['question'],
+                "user_answer": user_answer,
+                "correct_answer": q['answer'],
+                "correct": correct,
+                "explanation": q['explanation']
+            })
+        
+        db.save_quiz_result(quiz_level, score, len(selected_quiz), results)
+        
+        st.session_state.quiz_results = results
+        st.session_state.quiz_score = score
+        st.session_state.quiz_total = len(selected_quiz)
+        st.session_state.show_quiz_result = True
+        st.rerun()
+
+
+def show_quiz(bundle):
+    st.markdown('<p class="main-header">✏️ 전송장비 퀴즈</p>', unsafe_allow_html=True)
+    st.markdown("**전송장비에 대한 이해도를 테스트해보세요!**")
+    
+    quizzes = {
+        "기본": [
+            {
+                "question": "MSPP, PTN, POTN 중 가장 큰 스위칭 용량을 가진 것은?",
+                "options": ["MSPP", "PTN", "POTN"],
+                "answer": "POTN",
+                "explanation": "POTN은 최대 2.4Tbps의 스위칭 용량을 가지고 있어 세 가지 중 가장 큽니다."
+            },
+            {
+                "question": "MPLS-TP 기술을 사용하는 전송장비는?",
+                "options": ["MSPP만", "PTN과 POTN", "MSPP와 PTN"],
+                "answer": "PTN과 POTN",
+                "explanation": "PTN과 POTN은 MPLS-TP 기술을 사용합니다. MSPP는 SDH 기술을 사용합니다."
+            },
+            {
+                "question": "채널MUX 일체형 PTN 장비는?",
+                "options": ["APN-20D", "APN-200A", "OPN-3000"],
+                "answer": "APN-20D",
+                "explanation": "APN-20D는 채널MUX 기능이 내장된 일체형 장비로, DSO 서비스를 제공합니다."
+            }
+        ],
+        "중급": [
+            {
+                "question": "LEA-256 암호화를 지원하는 장비는?",
+                "options": ["APN-S40", "OPN-3000", "MSPP"],
+                "answer": "APN-S40",
+                "explanation": "APN-S40는 국내 표준 LEA-256 암호화를 지원하며, PQC와 QKD 연동도 가능합니다."
+            },
+            {
+                "question": "DWDM을 지원하지 않는 장비는?",
+                "options": ["OPN-3100", "OPN-3000", "APN-200A"],
+                "answer": "APN-200A",
+                "explanation": "APN-200A는 PTN 장비로 DWDM을 지원하지 않습니다. OPN 시리즈는 DWDM을 지원합니다."
+            },
+            {
+                "question": "프리밴 서비스에 주로 사용되는 장비는?",
+                "options": ["APN-20D", "OPN-3000과 APN-200A", "MSPP"],
+                "answer": "OPN-3000과 APN-200A",
+                "explanation": "프리밴 서비스는 전용회선+인터넷 통합 서비스로, OPN-3000과 APN-200A가 주로 사용됩니다."
+            }
+        ]
+    }
+
+    
+    tab1, tab2, tab3 = st.tabs(["📝 퀴즈 풀기","📊 결과 보기", "🏆 통계"])
+    
+    with tab1:
+        show_quiz_form(quizzes)
+    
+    with tab2:
+        if hasattr(st.session_state, 'show_quiz_result') and st.session_state.show_quiz_result:
+            score = st.session_state.quiz_score
+            total = st.session_state.quiz_total
+            results = st.session_state.quiz_results
+            
+            percentage = (score / total) * 100
+            
+            if percentage >= 80:
+                st.success(f"🎉 훌륭합니다! {score}/{total}점 ({percentage:.0f}%)")
+            elif percentage >= 60:
+                st.info(f"👍 잘하셨습니다! {score}/{total}점 ({percentage:.0f}%)")
+            else:
+                st.warning(f"💪 조금 더 학습이 필요합니다. {score}/{total}점 ({percentage:.0f}%)")
+            
+            st.markdown("---")
+            st.markdown("### 상세 결과")
+            
+            for idx, result in enumerate(results, 1):
+                if result['correct']:
+                    st.markdown(f"**Q{idx}. {result['question']}** ✅")
+                else:
+                    st.markdown(f"**Q{idx}. {result['question']}** ❌")
+                
+                st.markdown(f"- 내 답: {result['user_answer']}")
+                if not result['correct']:
+                    st.markdown(f"- 정답: {result['correct_answer']}")
+                st.markdown(f"- 해설: {result['explanation']}")
+                st.markdown("---")
+            
+            if st.button("다시 풀기"):
+                st.session_state.quiz_answers = {}
+                st.session_state.show_quiz_result = False
+                st.rerun()
+        else:
+            st.info("퀴즈를 풀고 제출하면 결과를 확인할 수 있습니다.")
+    
+    with tab3:
+        results = db.get_quiz_results()
+        
+        if results:
+            st.markdown(f"### 총 {len(results)}회 퀴즈 응시")
+            
+            for result in results[:10]:
+                percentage = (result.score / result.total_questions) * 100
+                st.markdown(f"**{result.quiz_id}** - {result.score}/{result.total_questions}점 ({percentage:.0f}%) - {result.completed_at.strftime('%Y-%m-%d %H:%M')}")
+        else:
+            st.info("아직 퀴즈 응시 기록이 없습니다.")
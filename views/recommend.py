@@ -0,0 +1,132 @@
+import streamlit as st
+
+
+@st.fragment
+def show_recommendation_panel():
+    """요구사항 입력/추천 결과 영역. 입력을 바꿔도 이 영역만 다시 실행된다."""
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 📝 요구사항 입력")
+        
+        service_type = st.selectbox(
+            "서비스 유형",
+            ["전용회선", "인터넷(프리밴)", "저속급(E1/DSO)", "보안 전송", "백본망", "액세스망"]
+        )
+        
+        capacity_need = st.selectbox(
+            "필요 용량",
+            ["소용량 (100G 이하)", "중용량 (100G~500G)", "대용량 (500G~1T)", "초대용량 (1T 이상)"]
+        )
+        
+        space_constraint = st.selectbox(
+            "공간 제약",
+            ["여유있음", "보통 (6U 이하)", "제약있음 (2U 이하)"]
+        )
+        
+        security_need = st.checkbox("암호화 필요")
+        ces_need = st.checkbox("TDM 신호 수용 필요 (CES)")
+        dwdm_need = st.checkbox("DWDM 필요")
+    
+    with col2:
+        st.markdown("### 🎯 추천 결과")
+        
+        if st.button("장비 추천 받기", type="primary"):
+            recommendations = []
+            
+            if service_type == "보안 전송" or security_need:
+                recommendations.append({
+                    "모델": "APN-S40",
+                    "이유": "LEA-256 암호화 지원, PQC/QKD 연동 가능",
+                    "적합도": "⭐⭐⭐⭐⭐"
+                })
+            
+            if service_type == "백본망" or "초대용량" in capacity_need:
+                if "여유있음" in space_constraint:
+                    recommendations.append({
+                        "모델": "OPN-3100",
+                        "이유": "2.4Tbps 초대용량, DWDM 지원, 100GE/OTU4*2",
+                        "적합도": "⭐⭐⭐⭐⭐"
+                    })
+                recommendations.append({
+                    "모델": "OPN-3000",
+                    "이유": "1.16Tbps 대용량, 12U 컴팩트, DWDM 지원",
+                    "적합도": "⭐⭐⭐⭐⭐"
+                })
+            
+            if service_type == "저속급(E1/DSO)":
+                recommendations.append({
+                    "모델": "APN-20D",
+                    "이유": "채널MUX 일체형, DSO 서비스 제공, 1U 초소형",
+                    "적합도": "⭐⭐⭐⭐⭐"
+                })
+            
+            if service_type in ["전용회선", "인터넷(프리밴)"]:
+                if "중용량" in capacity_need or "대용량" in capacity_need:
+                    recommendations.append({
+                        "모델": "APN-200A",
+                        "이유": "200G 중용량, CES 지원, 프리밴 적용",
+                        "적합도": "⭐⭐⭐⭐"
+                    })
+                    recommendations.append({
+                        "모델": "OPN-3000",
+                        "이유": "1.16T 대용량, COT/백본 적용",
+                        "적합도": "⭐⭐⭐⭐⭐"
+                    })
+                
+                if "소용량" in capacity_need:
+                    if "제약있음" in space_constraint:
+                        recommendations.append({
+                            "모델": "APN-50A",
+                            "이유": "60G 소용량, 1U 초소형",
+                            "적합도": "⭐⭐⭐⭐"
+                        })
+                    else:
+                        recommendations.append({
+                            "모델": "APN-60A",
+                            "이유": "64G 소용량, CES 지원, 2U",
+                            "적합도": "⭐⭐⭐⭐"
+                        })
+            
+            if ces_need and not service_type == "저속급(E1/DSO)":
+                recommendations.append({
+                    "모델": "APN-200A",
+                    "이유": "STM-1/E1 CES 지원, 중용량",
+                    "적합도": "⭐⭐⭐⭐"
+                })
+            
+            if dwdm_need:
+                recommendations.append({
+                    "모델": "OPN-3100",
+                    "이유": "DWDM 16/40ch 지원, 초대용량",
+                    "적합도": "⭐⭐⭐⭐⭐"
+                })
+            
+            if not recommendations:
+                recommendations.append({
+                    "모델": "APN-100A",
+                    "이유": "범용 중용량 PTN 장비, 4U",
+                    "적합도": "⭐⭐⭐"
+                })
+            
+            st.success(f"**{len(recommendations)}개의 장비를 추천합니다!**")
+            
+            for idx, rec in enumerate(recommendations, 1):
+                st.markdown(f"### {idx}. {rec['모델']}")
+                st.markdown(f"**적합도:** {rec['적합도']}")
+                st.markdown(f"**추천 이유:** {rec['이유']}")
+                
+                if st.button(f"{rec['모델']} 상세보기", key=f"detail_{idx}"):
+                    st.session_state.selected_equipment = rec['모델']
+                    st.session_state.goto_detail = True
+                
+                st.markdown("---")
+
+
+def recommend_equipment(bundle):
+    st.markdown('<p class="main-header">💡 장비 추천 시스템</p>', unsafe_allow_html=True)
+    st.markdown("**고객의 요구사항을 입력하시면 최적의 장비를 추천해드립니다.**")
+    
+    st.markdown("---")
+    
+    show_recommendation_panel()
@@ -0,0 +1,143 @@
+import streamlit as st
+
+import search_engine as se
+import spec_query as sq
+
+
+@st.cache_resource
+def get_search_cache():
+    return se.SearchCache(maxsize=512)
+
+
+def perform_search(bundle, query, rank=False):
+    return get_search_cache().get_or_compute(
+        bundle.catalog.version,
+        (se.normalize_query(query), rank),
+        lambda: bundle.search_index.hits(query, rank=rank)
+    )
+
+
+SEARCH_PAGE_SIZES = [10, 20, 50]
+SEARCH_FACETS = {"유형": "유형 (장비/용어/기술)", "분류": "장비 분류"}
+
+
+def set_main_search(query):
+    st.session_state.main_search = query
+
+
+def show_spec_filter(bundle):
+    spec_index = bundle.spec_index
+    expression = st.text_input(
+        "📐 스펙 조건을 입력하세요",
+        placeholder="예: 10GbE포트>=32 and 소모전력(W)<500 and 크기(U)<=4",
+        help="조건은 and 또는 쉼표로 잇습니다. 연산자: >=, <=, >, <, =, !=",
+        key="spec_filter"
+    )
+    st.caption(f"사용 가능한 컬럼: {', '.join(spec_index.columns)}")
+    
+    if not expression:
+        st.info("숫자 스펙 조건으로 장비를 찾아보세요.")
+        return
+    try:
+        matched = spec_index.query(expression)
+    except sq.SpecFilterError as e:
+        st.error(str(e))
+        return
+    
+    if len(matched):
+        st.success(f"**{len(matched)}개의 장비가 조건을 만족합니다.**")
+        st.dataframe(matched, use_container_width=True, hide_index=True)
+    else:
+        st.warning("조건을 만족하는 장비가 없습니다. 조건을 완화해보세요.")
+
+
+def show_search(bundle):
+    st.markdown('<p class="main-header">🔍 통합 검색</p>', unsafe_allow_html=True)
+    
+    search_mode = st.radio("검색 방식", ["키워드 검색", "스펙 필터"], horizontal=True, key="search_mode")
+    if search_mode == "스펙 필터":
+        show_spec_filter(bundle)
+        return
+    
+    search_query = st.text_input(
+        "🔎 검색어를 입력하세요",
+        placeholder="예: MPLS, OPN-3000, 암호화, 전용회선, ㅈㅇㅎㅅ(초성)...",
+        help='AND / OR / NOT 과 괄호, 큰따옴표 구문 검색을 지원합니다. 예: PTN AND CES NOT APN-20D, "50ms 절체"',
+        key="main_search"
+    )
+    
+    sort_order = st.radio("정렬 기준", ["관련도순", "분류순"], horizontal=True)
+    
+    if search_query:
+        if se.is_chosung_query(search_query):
+            st.caption(f"🔤 초성 검색: **{search_query.strip()}**")
+        all_hits = perform_search(bundle, search_query, rank=(sort_order == "관련도순"))
+        
+        if all_hits.total:
+            facet_counts = all_hits.facet_counts()
+            filters = {}
+            facet_cols = st.columns(len(SEARCH_FACETS))
+            for col, (facet, label) in zip(facet_cols, SEARCH_FACETS.items()):
+                counts = facet_counts.get(facet, {})
+                with col:
+                    filters[facet] = st.multiselect(
+                        label,
+                        list(counts),
+                        format_func=lambda value, counts=counts: f"{value} ({counts[value]})",
+                        key=f"search_facet_{facet}"
+                    )
+            hits = all_hits.refine(filters)
+            # 페이지 위젯 키: 검색어/필터가 바뀌면 1쪽으로 돌아가도록 (hits.bits 는 문서 수만큼 커지므로 쓰지 않는다)
+            filter_key = tuple((facet, tuple(values)) for facet, values in filters.items())
+            
+            st.success(f"**{hits.total}개의 결과를 찾았습니다.**")
+            cache_stats = get_search_cache().stats()
+            st.caption(f"검색 캐시: 적중 {cache_stats['hits']} / 미스 {cache_stats['misses']} ({cache_stats['hit_rate']:.0%})")
+            
+            col1, col2 = st.columns([1, 3])
+            with col1:
+                page_size = st.selectbox("페이지당 결과", SEARCH_PAGE_SIZES, key="search_page_size")
+            page_count = hits.page_count(page_size)
+            with col2:
+                page_number = st.number_input(
+                    f"페이지 (총 {page_count}쪽)",
+                    min_value=1,
+                    max_value=page_count,
+                    value=1,
+                    key=f"search_page_{se.normalize_query(search_query)}_{page_size}_{filter_key}"
+                )
+            
+            for idx, result in enumerate(hits.page(page_number, page_size)):
+                with st.expander(f"[{result['유형']}] {result['제목']}", expanded=(page_number == 1 and idx < 3)):
+                    st.markdown(f"**카테고리:** {result['카테고리']}")
+                    st.markdown(f"**내용:** {result['스니펫'] or result['내용']}")
+        else:
+            st.warning("검색 결과가 없습니다. 다른 검색어를 시도해보세요.")
+            
+            suggestions = bundle.search_index.suggest(search_query)
+            if suggestions:
+                st.markdown("**혹시 이것을 찾으셨나요?**")
+                cols = st.columns(len(suggestions))
+                for col, suggestion in zip(cols, suggestions):
+                    with col:
+                        st.button(suggestion, key=f"suggest_{suggestion}", on_click=set_main_search, args=(suggestion,))
+    else:
+        st.info("장비명, 기술명, 용어 등을 검색해보세요.")
+        
+        st.markdown("### 💡 추천 검색어")
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.markdown("**장비 검색**")
+            st.button("OPN-3000", on_click=set_main_search, args=("OPN-3000",))
+            st.button("APN-200A", on_click=set_main_search, args=("APN-200A",))
+        
+        with col2:
+            st.markdown("**기술 검색**")
+            st.button("MPLS-TP", on_click=set_main_search, args=("MPLS-TP",))
+            st.button("암호화", on_click=set_main_search, args=("암호화",))
+        
+        with col3:
+            st.markdown("**서비스 검색**")
+            st.button("전용회선", on_click=set_main_search, args=("전용회선",))
+            st.button("프리밴", on_click=set_main_search, args=("프리밴",))
@@ -0,0 +1,329 @@
+import functools
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import streamlit as st
+from openai import OpenAI, RateLimitError
+from sqlalchemy.exc import SQLAlchemyError
+
+import database as db
+from rate_limit import RateLimiter, RateLimitTimeout
+from singleflight import SingleFlight, SingleFlightTimeout
+
+logger = logging.getLogger(__name__)
+
+# 같은 (검색어, 국가, 날짜) 결과를 DB 에 보관하는 시간. 0 이면 캐시를 쓰지 않는다.
+WEB_SEARCH_CACHE_TTL = int(os.getenv("WEB_SEARCH_CACHE_TTL", "3600"))
+
+WEB_SEARCH_COUNTRIES = ["KR", "US", "JP", "EU"]
+ALL_COUNTRIES = "전체 (동시 검색)"
+
+# 아래 객체들은 모듈이 프로세스당 한 번 import 되므로 모든 세션이 공유한다.
+# 작업 스레드에서도 쓰이므로 st.cache_resource (스크립트 실행 컨텍스트 필요) 대신 모듈 수준에 둔다.
+#  - 같은 검색이 동시에 여러 세션에서 들어오면 업스트림 호출은 하나만 하고 결과를 나눠 받는다
+#    (먼저 시작한 호출을 최대 WEB_SEARCH_FLIGHT_TIMEOUT 초까지 기다린다)
+#  - 전체 지역 검색은 크기가 제한된 스레드 풀에서 동시에 실행한다
+WEB_SEARCH_FLIGHT = SingleFlight()
+WEB_SEARCH_FLIGHT_TIMEOUT = float(os.getenv("WEB_SEARCH_FLIGHT_TIMEOUT", "120"))
+WEB_SEARCH_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("WEB_SEARCH_MAX_WORKERS", "4")),
+    thread_name_prefix="web-search"
+)
+#  - OpenAI 호출 전 분당 요청/토큰 한도와 동시 호출 수를 확인하고, 자리가 없으면 최대 WEB_SEARCH_MAX_WAIT 초 기다린다
+#    (토큰은 호출 전 WEB_SEARCH_TOKEN_ESTIMATE 로 잡아 두고 응답의 실제 사용량으로 보정)
+WEB_SEARCH_TOKEN_ESTIMATE = int(os.getenv("WEB_SEARCH_TOKEN_ESTIMATE", "4000"))
+WEB_SEARCH_MAX_WAIT = float(os.getenv("WEB_SEARCH_MAX_WAIT", "30"))
+WEB_SEARCH_LIMITER = RateLimiter(
+    requests_per_minute=int(os.getenv("OPENAI_RPM", "60")),
+    tokens_per_minute=int(os.getenv("OPENAI_TPM", "30000")),
+    max_in_flight=int(os.getenv("OPENAI_MAX_IN_FLIGHT", "4"))
+)
+
+
+@functools.lru_cache(maxsize=1)
+def get_openai_client():
+    """OpenAI 클라이언트는 웹 서치를 처음 실행할 때 한 번만 만든다."""
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+
+def normalize_web_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+def call_openai_web_search(query: str, country: str = "KR"):
+    """
+    OpenAI Responses API (web_search_preview) 호출.
+    반환: [{'text': str, 'citations': [{'title':..., 'url':...}]}]
+    성공한 결과는 WEB_SEARCH_CACHE_TTL 동안 DB 에 캐시한다 (오류/파싱 실패는 캐시하지 않음).
+    """
+    if not os.getenv("OPENAI_API_KEY"):
+        return [{"text": "⚠️ OPENAI_API_KEY가 설정되지 않았습니다.", "citations": []}]
+
+    today = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%Y-%m-%d")
+    cache_query = normalize_web_query(query)
+    cached = _read_cache(cache_query, country, today)
+    if cached is not None:
+        return cached
+
+    try:
+        return WEB_SEARCH_FLIGHT.do(
+            (cache_query, country, today),
+            lambda: _request_web_search(query, country, today, cache_query),
+            timeout=WEB_SEARCH_FLIGHT_TIMEOUT
+        )
+    except SingleFlightTimeout as e:
+        return [_error_result(e)]
+
+
+def _read_cache(cache_query: str, country: str, today: str):
+    """캐시된 결과 또는 None. 캐시는 보조 수단이라 DB 오류는 기록만 하고 캐시가 없는 것으로 본다."""
+    if WEB_SEARCH_CACHE_TTL <= 0:
+        return None
+    try:
+        return db.get_cached_web_search(cache_query, country, today, WEB_SEARCH_CACHE_TTL)
+    except SQLAlchemyError:
+        logger.warning("웹 서치 캐시 읽기 실패: %s (%s)", cache_query, country, exc_info=True)
+        return None
+
+
+def _write_cache(cache_query: str, country: str, today: str, results):
+    """결과를 캐시에 저장. DB 오류는 기록만 하고 넘어간다 (받은 결과는 그대로 보여 준다)."""
+    if WEB_SEARCH_CACHE_TTL <= 0:
+        return
+    try:
+        db.save_web_search(cache_query, country, today, results)
+    except SQLAlchemyError:
+        logger.warning("웹 서치 캐시 저장 실패: %s (%s)", cache_query, country, exc_info=True)
+
+
+def _web_search_request(query: str, country: str, today: str):
+    """responses.create 인자 (일반/스트리밍 공통)."""
+    input_text = (
+        f"Today is {today}. "
+        f"Country context: {country}. "
+        f"Find positive, verifiable news related to: {query}. "
+        "Summarize concisely (3-5 bullets). Provide inline citations."
+    )
+    return dict(
+        model="gpt-4.1",
+        tools=[{"type": "web_search_preview"}],  # 최소 형태(중요)
+        input=input_text,
+        temperature=0.3,
+        top_p=1.0
+    )
+
+
+def _citation(ann):
+    if getattr(ann, "type", "") != "url_citation":
+        return None
+    return {
+        "title": getattr(ann, "title", "") or "Source",
+        "url": getattr(ann, "url", "") or ""
+    }
+
+
+def _used_tokens(resp):
+    return getattr(getattr(resp, "usage", None), "total_tokens", None)
+
+
+def _error_result(e: Exception):
+    if isinstance(e, SingleFlightTimeout):
+        text = "⏳ 같은 검색이 아직 진행 중입니다. 잠시 후 다시 시도해주세요."
+    elif isinstance(e, RateLimitTimeout):
+        text = f"⏳ 지금은 웹 서치 요청이 많습니다. 약 {e.wait:.0f}초 후 다시 시도해주세요."
+    elif isinstance(e, RateLimitError):
+        text = "⏳ OpenAI 사용 한도에 도달했습니다. 잠시 후 다시 시도해주세요."
+    else:
+        text = f"⚠️ OpenAI 호출 오류: {getattr(e, 'message', str(e))}"
+    return {"text": text, "citations": []}
+
+
+def _request_web_search(query: str, country: str, today: str, cache_query: str):
+    try:
+        with WEB_SEARCH_LIMITER.limit(WEB_SEARCH_TOKEN_ESTIMATE, WEB_SEARCH_MAX_WAIT) as usage:
+            resp = get_openai_client().responses.create(**_web_search_request(query, country, today))
+            usage["tokens"] = _used_tokens(resp)
+
+        results = []
+        for item in getattr(resp, "output", []) or []:
+            if getattr(item, "type", "") == "message":
+                for c in getattr(item, "content", []) or []:
+                    if getattr(c, "type", "") == "output_text":
+                        text = getattr(c, "text", "") or ""
+                        cites = [
+                            cite for cite in map(_citation, getattr(c, "annotations", []) or [])
+                            if cite is not None
+                        ]
+                        results.append({"text": text, "citations": cites})
+
+    except Exception as e:
+        return [_error_result(e)]
+
+    if not results:
+        return [{"text": "검색 결과를 파싱하지 못했습니다. 쿼리를 바꿔 다시 시도해보세요.", "citations": []}]
+    _write_cache(cache_query, country, today, results)
+    return results
+
+
+def stream_openai_web_search(query: str, country: str = "KR"):
+    """
+    call_openai_web_search 의 스트리밍 버전 (제너레이터).
+    텍스트 조각이나 출처 이벤트가 올 때마다 (결과 번호, {'text': 지금까지의 텍스트, 'citations': [...]}) 를 내보낸다.
+    캐시에 있으면 캐시된 결과를 바로 내보내고, 끝까지 받은 결과는 캐시에 저장한다.
+    같은 검색이 이미 진행 중이면 그 호출이 끝난 뒤 완성된 결과를 한 번에 내보낸다.
+    """
+    if not os.getenv("OPENAI_API_KEY"):
+        yield 0, {"text": "⚠️ OPENAI_API_KEY가 설정되지 않았습니다.", "citations": []}
+        return
+
+    today = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%Y-%m-%d")
+    cache_query = normalize_web_query(query)
+    cached = _read_cache(cache_query, country, today)
+    if cached is not None:
+        yield from enumerate(cached)
+        return
+
+    # 같은 검색을 다른 세션이 이미 받고 있으면 (스트리밍이든 아니든) 새로 호출하지 않고 그 결과를 기다린다.
+    # 직접 받는 쪽은 끝까지 받은 결과를 WEB_SEARCH_FLIGHT 로 넘겨 call_openai_web_search 쪽 대기도 함께 풀어 준다.
+    key = (cache_query, country, today)
+    call, leader = WEB_SEARCH_FLIGHT.join(key)
+    if not leader:
+        try:
+            shared = WEB_SEARCH_FLIGHT.wait(call, WEB_SEARCH_FLIGHT_TIMEOUT)
+        except SingleFlightTimeout as e:
+            shared = [_error_result(e)]
+        yield from enumerate(shared)
+        return
+
+    # 화면을 떠나 제너레이터가 중간에 닫히면 기다리던 쪽에는 이 결과가 간다
+    final = [_error_result(RuntimeError("스트리밍이 중단되었습니다"))]
+    try:
+        final = yield from _stream_web_search(query, country, today, cache_query)
+    finally:
+        WEB_SEARCH_FLIGHT.finish(key, call, final)
+
+
+def _stream_web_search(query: str, country: str, today: str, cache_query: str):
+    """stream_openai_web_search 의 실제 호출부. 내보낸 것과 같은 최종 결과 목록을 반환한다."""
+    # (output_index, content_index) → 결과 번호 / 결과
+    order = {}
+    results = []
+    try:
+        # 스트림을 다 받을 때까지 동시 호출 자리를 잡고 있는다
+        with WEB_SEARCH_LIMITER.limit(WEB_SEARCH_TOKEN_ESTIMATE, WEB_SEARCH_MAX_WAIT) as usage:
+            stream = get_openai_client().responses.create(**_web_search_request(query, country, today), stream=True)
+            for event in stream:
+                event_type = getattr(event, "type", "")
+                if event_type in ("response.output_text.delta", "response.output_text.annotation.added"):
+                    idx = order.setdefault((event.output_index, event.content_index), len(order))
+                    if idx == len(results):
+                        results.append({"text": "", "citations": []})
+                    if event_type == "response.output_text.delta":
+                        results[idx]["text"] += event.delta
+                    else:
+                        cite = _citation(event.annotation)
+                        if cite is None:
+                            continue
+                        results[idx]["citations"].append(cite)
+                    yield idx, results[idx]
+                elif event_type == "response.completed":
+                    usage["tokens"] = _used_tokens(event.response)
+                elif event_type == "error":
+                    raise RuntimeError(getattr(event, "message", "") or "stream error")
+                elif event_type == "response.failed":
+                    error = getattr(event.response, "error", None)
+                    raise RuntimeError(getattr(error, "message", "") or "response failed")
+    except Exception as e:
+        error = _error_result(e)
+        yield len(results), error
+        return results + [error]
+
+    if not results:
+        results = [{"text": "검색 결과를 파싱하지 못했습니다. 쿼리를 바꿔 다시 시도해보세요.", "citations": []}]
+        yield 0, results[0]
+        return results
+    _write_cache(cache_query, country, today, results)
+    return results
+
+
+def show_web_search_result(r):
+    st.markdown(r.get("text", ""))
+    if r.get("citations"):
+        st.markdown("**🔗 출처**")
+        for c in r["citations"]:
+            url = c.get("url") or ""
+            title = c.get("title") or "Source"
+            if url:
+                st.markdown(f"- [{title}]({url})")
+
+
+def show_web_search_results(results):
+    for idx, r in enumerate(results, 1):
+        st.markdown(f"### 결과 {idx}")
+        show_web_search_result(r)
+        st.markdown("---")
+
+
+def show_streamed_web_search(query: str, country: str):
+    """스트리밍 결과를 도착하는 대로 그린다. 결과마다 자리를 하나 잡고 그 자리만 다시 그린다."""
+    slots = {}
+    for idx, r in stream_openai_web_search(query, country):
+        if idx not in slots:
+            st.markdown(f"### 결과 {idx + 1}")
+            slots[idx] = st.empty()
+            st.markdown("---")
+        with slots[idx].container():
+            show_web_search_result(r)
+
+
+def show_all_country_results(query: str):
+    """모든 지역을 동시에 검색하고, 끝나는 지역부터 자기 자리에 결과를 그린다."""
+    slots = {}
+    for country in WEB_SEARCH_COUNTRIES:
+        st.markdown(f"## 🌏 {country}")
+        slots[country] = st.empty()
+        slots[country].info(f"{country} 검색 중...")
+
+    futures = {
+        WEB_SEARCH_POOL.submit(call_openai_web_search, query, country): country
+        for country in WEB_SEARCH_COUNTRIES
+    }
+    for future in as_completed(futures):
+        with slots[futures[future]].container():
+            show_web_search_results(future.result())
+
+
+def show_openai_web_search_page(bundle):
+    st.markdown("## 📰 웹 서치 (OpenAI)")
+    st.markdown("키워드를 입력하면 ‘관련 최신 뉴스(주가 관련 뉴스 제외)/블로그 자료’ 등을 중심으로 간단 요약과 출처를 보여줍니다.")
+    st.markdown("---")
+
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        query = st.text_input(
+            "검색어",
+            value="MSPP 장비",
+            placeholder="예: AI datacenter, 5G enterprise ..."
+        )
+    with col2:
+        country = st.selectbox("국가", options=WEB_SEARCH_COUNTRIES + [ALL_COUNTRIES], index=0)
+    streaming = st.toggle("실시간 스트리밍 표시", value=True, help="생성되는 대로 바로 보여줍니다. 전체 지역 검색에는 적용되지 않습니다.")
+
+    if st.button("검색 실행", type="primary"):
+        calls = len(WEB_SEARCH_COUNTRIES) if country == ALL_COUNTRIES else 1
+        wait = WEB_SEARCH_LIMITER.wait_estimate(WEB_SEARCH_TOKEN_ESTIMATE * calls)
+        if wait >= 1:
+            st.info(f"⏳ 요청이 몰려 있어 약 {wait:.0f}초 기다린 뒤 실행됩니다. (캐시된 검색은 바로 표시)")
+        if country == ALL_COUNTRIES:
+            show_all_country_results(query)
+        elif streaming:
+            show_streamed_web_search(query, country)
+        else:
+            with st.spinner("OpenAI 웹서치 중..."):
+                results = call_openai_web_search(query, country)
+            show_web_search_results(results)
+    else:
+        st.info("검색어를 입력하고 **검색 실행**을 눌러주세요.")